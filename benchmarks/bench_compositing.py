@@ -0,0 +1,54 @@
+import numpy as np
+from benchmarks.common import measure
+
+RESOLUTIONS = {"720p": (1280, 720), "1080p": (1920, 1080)}
+SPRITE_COUNTS = (5, 18, 50, 200)
+
+def legacy_overlay(bg, fg, x, y):
+    # Implementasi _overlay_image lama (float per kanal) sebagai pembanding
+    h, w = fg.shape[:2]
+    if x < 0 or y < 0 or x + w > bg.shape[1] or y + h > bg.shape[0]:
+        return bg
+    alpha = fg[:, :, 3] / 255.0
+    for c in range(3):
+        bg[y:y+h, x:x+w, c] = (alpha * fg[:, :, c] + (1 - alpha) * bg[y:y+h, x:x+w, c]).astype(np.uint8)
+    return bg
+
+def synthetic_sprites(rng, n):
+    sprites = []
+    for _ in range(n):
+        size = int(rng.integers(70, 121))
+        img = rng.integers(0, 256, (size, size, 4), dtype=np.uint8)
+        yy, xx = np.mgrid[:size, :size]
+        r = size / 2
+        img[:, :, 3] = np.where((xx - r) ** 2 + (yy - r) ** 2 < r * r, 255, 0)
+        sprites.append(img)
+    return sprites
+
+def run(quick=False):
+    from core.compositor import Compositor, Sprite
+
+    rng = np.random.default_rng(0)
+    counts = SPRITE_COUNTS[:2] if quick else SPRITE_COUNTS
+    repeat = 5 if quick else 20
+    results = []
+    for res_name, (w, h) in RESOLUTIONS.items():
+        frame = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+        for n in counts:
+            images = synthetic_sprites(rng, n)
+            sprites = [Sprite(img) for img in images]
+            positions = [(int(rng.integers(0, w - 120)), int(rng.integers(0, h - 120))) for _ in range(n)]
+            compositor = Compositor()
+            params = {"resolution": res_name, "sprites": n}
+
+            def compose():
+                for sprite, (x, y) in zip(sprites, positions):
+                    compositor.blit(frame, sprite, x, y)
+
+            def legacy():
+                for img, (x, y) in zip(images, positions):
+                    legacy_overlay(frame, img, x, y)
+
+            results.append(measure("compositor.blit", compose, params, repeat))
+            results.append(measure("legacy_overlay_image", legacy, params, repeat))
+    return results
@@ -0,0 +1,50 @@
+import numpy as np
+from benchmarks.common import measure
+
+FRUIT_COUNTS = (5, 18, 100, 500, 2000, 5000)
+
+def _headless_game(mode):
+    from game.headless import HeadlessRuntime
+    if mode == "solo":
+        from game.solo_game import SoloFruitNinjaGame as GameClass
+    else:
+        from game.multi_game import MultiFruitNinjaGame as GameClass
+    return GameClass(runtime=HeadlessRuntime().start(), seed=0)
+
+def run(quick=False):
+    from core.fruit import FruitManager, FruitPool
+    from core.sprite_atlas import SpriteAtlas
+    from core.spatial_grid import SpatialGrid
+
+    repeat = 5 if quick else 20
+    atlas = SpriteAtlas()
+    manager = FruitManager(1280, 720, atlas=atlas, seed=0)
+    results = [
+        measure("FruitManager.spawn_fruit_solo", lambda: manager.spawn_fruit_solo(3), {}, repeat, number=100),
+        measure("FruitManager.spawn_fruit_multi", lambda: manager.spawn_fruit_multi(3), {}, repeat, number=100),
+    ]
+
+    counts = FRUIT_COUNTS[:2] if quick else FRUIT_COUNTS
+    for n in counts:
+        pool = FruitPool(n)
+        pool.activate(n)
+        manager.fill_solo(pool, pool.free_slots(), 1)
+        params = {"fruits": n}
+        results.append(measure("fill_solo", lambda: manager.fill_solo(pool, np.arange(n), 3), params, repeat))
+
+        # Cek tumpukan spawn brute-force vs indeks grid (ambang default ada di antaranya)
+        for name, grid in (("pool_update", SpatialGrid(1280, 720, min_fruits=n + 1)),
+                           ("pool_update+grid", SpatialGrid(1280, 720, min_fruits=0))):
+            def update():
+                pool.step(720)
+                grid.update(pool)
+                manager.fill_solo(pool, pool.free_slots(), 3, grid=grid)
+
+            manager.fill_solo(pool, np.arange(n), 1)
+            results.append(measure(name, update, params, repeat, number=20))
+
+    for mode in ("solo", "multi"):
+        game = _headless_game(mode)
+        results.append(measure(f"{mode}._update_fruits", game._update_fruits, {}, repeat, number=100))
+        game._cleanup()
+    return results
@@ -0,0 +1,57 @@
+import os
+import tempfile
+from benchmarks.common import measure
+
+HISTORY_SIZES = (10_000, 100_000)
+
+def _populate(store, rows):
+    from core.results_store import INSERTS
+
+    conn = store.connect()
+    with conn:
+        conn.executemany(
+            INSERTS["solo"],
+            ((f"2026-01-{1 + i % 28:02d} 12:00", (i * 7919) % 5000, i % 10, 1 + i % 12) for i in range(rows)),
+        )
+        conn.executemany(
+            INSERTS["multiplayer"],
+            ((f"2026-01-{1 + i % 28:02d} 12:00", i % 300, (i * 31) % 300, 1 + i % 12, "Draw", max(i % 300, (i * 31) % 300))
+             for i in range(rows)),
+        )
+    conn.close()
+
+def run(quick=False):
+    from core.results_store import ResultsStore
+    from core.leaderboard import Leaderboard
+    from core.dataexcel import GameDataSaver
+
+    repeat = 5 if quick else 20
+    sizes = HISTORY_SIZES[:1] if quick else HISTORY_SIZES
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            store = ResultsStore(os.path.join(tmp, f"bench_{rows}.db"))
+            _populate(store, rows)
+            board = Leaderboard(store)
+            params = {"history_rows": rows}
+
+            results.append(measure("ResultsStore.save_solo (enqueue)",
+                                   lambda: store.save_solo(score=123, missed=4, level=3), params, repeat, number=50))
+            results.append(measure("ResultsStore.save_multiplayer (enqueue)",
+                                   lambda: store.save_multiplayer(player1=50, player2=40, level=3), params, repeat, number=50))
+
+            def save_and_flush():
+                store.save_solo(score=123, missed=4, level=3)
+                store.flush()
+
+            results.append(measure("ResultsStore.save_solo+flush", save_and_flush, params, repeat))
+            results.append(measure("Leaderboard.top(10)", lambda: board.top("solo", 10), params, repeat))
+            results.append(measure("Leaderboard.rank", lambda: board.rank("solo", 2500), params, repeat))
+            results.append(measure("Leaderboard.top(level=5)", lambda: board.top("solo", 10, level=5), params, repeat))
+
+            xlsx = GameDataSaver(os.path.join(tmp, f"bench_{rows}.xlsx"))
+            results.append(measure("GameDataSaver.export", lambda: xlsx.export(store), params, repeat=1 if rows > 10_000 else 3))
+
+            board.close()
+            store.close()
+    return results
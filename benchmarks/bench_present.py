@@ -0,0 +1,47 @@
+import numpy as np
+from benchmarks.common import measure
+
+RESOLUTIONS = {"720p": (1280, 720), "1080p": (1920, 1080)}
+
+def run(quick=False):
+    import cv2
+    import pygame
+    from game.presenter import FramePresenter
+
+    pygame.display.init()
+    repeat = 5 if quick else 30
+    results = []
+    for res_name, (w, h) in RESOLUTIONS.items():
+        screen = pygame.display.set_mode((w, h))
+        background = np.random.default_rng(0).integers(0, 256, (h, w, 3), dtype=np.uint8)
+        params = {"resolution": res_name}
+
+        def legacy_present():
+            frame = background.copy()
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
+            screen.blit(surface, (0, 0))
+
+        presenter = FramePresenter(w, h)
+
+        def zero_copy_present():
+            presenter.invalidate()
+            presenter.begin(background)
+            presenter.present(screen)
+
+        # 18 sprite 120x120 + HUD: hanya area itu yang dipulihkan dan dikirim
+        rng = np.random.default_rng(1)
+        rects = [(int(rng.integers(0, w - 120)), int(rng.integers(0, h - 120)), 120, 120) for _ in range(18)]
+        rects.append((0, 0, 520, 200))
+
+        def dirty_present():
+            presenter.begin(background)
+            for rect in rects:
+                presenter.add(rect)
+            pygame.display.update(presenter.present(screen))
+
+        results.append(measure("bgr_rgb_make_surface", legacy_present, params, repeat))
+        results.append(measure("FramePresenter", zero_copy_present, dict(params, shared=presenter.shared), repeat))
+        results.append(measure("FramePresenter+dirty_rects", dirty_present, dict(params, rects=len(rects)), repeat))
+    pygame.display.quit()
+    return results
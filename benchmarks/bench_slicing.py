@@ -0,0 +1,58 @@
+import numpy as np
+from benchmarks.common import measure
+
+FRUIT_COUNTS = (5, 18, 100, 500, 2000, 5000)
+
+def legacy_point_slice(pool, px, py):
+    # Loop titik-dalam-kotak lama, per buah di Python
+    hits = []
+    for i in pool.live_slots():
+        size = pool.size[i]
+        if pool.x[i] < px < pool.x[i] + size and pool.y[i] < py < pool.y[i] + size:
+            hits.append(i)
+    return hits
+
+def run(quick=False):
+    from core.fruit import FruitManager, FruitPool
+    from core.sprite_atlas import SpriteAtlas
+    from core.spatial_grid import SpatialGrid
+    from core.collision import slice_segment
+
+    repeat = 5 if quick else 20
+    manager = FruitManager(1280, 720, atlas=SpriteAtlas(), seed=0)
+    rng = np.random.default_rng(0)
+    results = []
+    counts = FRUIT_COUNTS[:2] if quick else FRUIT_COUNTS
+    for n in counts:
+        pool = FruitPool(n)
+        pool.activate(n)
+        manager.fill_solo(pool, pool.free_slots(), 1)
+        # Sebar buah di area layar supaya ada yang kena
+        pool.y[:n] = rng.integers(0, 640, n)
+        # min_fruits=0: indeks grid selalu dipakai, supaya titik impasnya terlihat
+        grid = SpatialGrid(1280, 720, min_fruits=0)
+        grid.update(pool)
+
+        segments = [((float(rng.integers(0, 1280)), float(rng.integers(0, 720))),
+                     (float(rng.integers(0, 1280)), float(rng.integers(0, 720)))) for _ in range(50)]
+        short = [((x, y), (x + 40, y + 25)) for (x, y), _ in segments]
+        params = {"fruits": n, "segments": len(segments)}
+
+        def legacy():
+            for _, (x, y) in short:
+                legacy_point_slice(pool, x, y)
+
+        def swept():
+            for a, b in short:
+                slice_segment(pool, a, b)
+
+        def swept_grid():
+            for a, b in short:
+                slice_segment(pool, a, b, grid)
+
+        if n <= 500:
+            # Loop Python lama terlalu lambat untuk ribuan buah
+            results.append(measure("legacy_point_in_rect", legacy, params, repeat))
+        results.append(measure("slice_segment", swept, params, repeat))
+        results.append(measure("slice_segment+grid", swept_grid, params, repeat))
+    return results
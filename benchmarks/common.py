@@ -0,0 +1,51 @@
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def setup():
+    # Semua benchmark jalan tanpa kamera/jendela/audio dari root repo (path aset relatif)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.chdir(ROOT)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+def measure(name, fn, params=None, repeat=20, number=1, setup_fn=None):
+    samples = []
+    for _ in range(repeat):
+        if setup_fn is not None:
+            setup_fn()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+
+    samples.sort()
+    return {
+        "name": name,
+        "params": params or {},
+        "repeat": repeat,
+        "number": number,
+        "mean_ms": sum(samples) / len(samples),
+        "min_ms": samples[0],
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+        "max_ms": samples[-1],
+    }
+
+def write_results(results, out=None):
+    report = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if out:
+        with open(out, "w") as f:
+            f.write(text)
+    return text
@@ -0,0 +1,36 @@
+import argparse
+import importlib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import setup, write_results
+
+SUITES = ("compositing", "fruits", "slicing", "present", "persistence", "pipeline")
+
+def main():
+    parser = argparse.ArgumentParser(description="Jalankan benchmark hot path game")
+    parser.add_argument("suites", nargs="*", metavar="suite", help="pilihan: " + ", ".join(SUITES))
+    parser.add_argument("--quick", action="store_true", help="parameter kecil, untuk cek cepat")
+    parser.add_argument("--out", default="bench_output.json")
+    args = parser.parse_args()
+    for name in args.suites:
+        if name not in SUITES:
+            parser.error(f"suite tidak dikenal: {name}")
+
+    setup()
+    results = []
+    for name in args.suites or SUITES:
+        module = importlib.import_module(f"benchmarks.bench_{name}")
+        print(f"== {name}", flush=True)
+        for result in module.run(quick=args.quick):
+            result["suite"] = name
+            print(f"  {result['name']:<40} {result['params']}  p50={result['p50_ms']:.3f} ms", flush=True)
+            results.append(result)
+
+    write_results(results, args.out)
+    print(f"Hasil ditulis ke {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dijalankan di proses baru supaya cache impor kosong (cold start)
+FIRST_FRAME_SCRIPT = """
+import json, os, time
+t0 = time.perf_counter()
+import pygame
+from ui.navigation import MenuApp
+t_import = time.perf_counter()
+app = MenuApp()
+t_init = time.perf_counter()
+app.reset_layar()
+app.begin_frame()
+app.draw_main_menu()
+pygame.display.update()
+t_frame = time.perf_counter()
+print(json.dumps({
+    "import_s": t_import - t0,
+    "menu_init_s": t_init - t_import,
+    "first_frame_s": t_frame - t0,
+}), flush=True)
+app.runtime.wait_ready()
+print(json.dumps({"runtime_ready_s": time.perf_counter() - t0}), flush=True)
+os._exit(0)
+"""
+
+def _env(db_dir=None):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    # Tanpa webcam, dan skor/migrasi database tidak menyentuh game_data.db pemain
+    env.setdefault("NINJA_CAMERA", "synthetic")
+    if db_dir is not None:
+        env["NINJA_DB"] = os.path.join(db_dir, "startup.db")
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+def _read_json(stream):
+    # Lewati output lain (banner pygame, pesan loading) sampai baris JSON
+    for line in stream:
+        try:
+            return json.loads(line)
+        except ValueError:
+            continue
+    return None
+
+def time_to_first_frame(wait_runtime=True):
+    with tempfile.TemporaryDirectory() as tmp:
+        return _time_to_first_frame(tmp, wait_runtime)
+
+def _time_to_first_frame(db_dir, wait_runtime):
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", FIRST_FRAME_SCRIPT],
+        cwd=ROOT, env=_env(db_dir), stdout=subprocess.PIPE, text=True,
+    )
+    result = _read_json(proc.stdout)
+    if result is None:
+        proc.wait()
+        raise RuntimeError(f"Proses menu gagal (exit code {proc.returncode})")
+    result["process_first_frame_s"] = time.perf_counter() - start
+
+    if wait_runtime:
+        ready = _read_json(proc.stdout)
+        if ready is not None:
+            result.update(ready)
+    else:
+        proc.kill()
+    proc.wait()
+    return result
+
+def import_breakdown(module, top=15):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=_env(), capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append({
+            "module": name.strip(),
+            "top_level": not name[1:].startswith(" "),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+
+    # Hanya modul tingkat atas (tanpa indentasi) yang dijumlah
+    total = sum(r["cumulative_ms"] for r in rows if r["top_level"])
+    rows.sort(key=lambda r: r["cumulative_ms"], reverse=True)
+    return {"module": module, "returncode": proc.returncode, "top": rows[:top], "rows": len(rows), "total_ms": total}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu start sampai frame menu pertama")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    runs = [time_to_first_frame() for _ in range(args.runs)]
+    report = {
+        "benchmark": "startup",
+        "runs": runs,
+        "imports": [
+            import_breakdown("ui.navigation"),
+            import_breakdown("game.solo_game"),
+        ],
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    print(text)
+
+if __name__ == "__main__":
+    main()
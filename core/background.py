@@ -0,0 +1,35 @@
+from collections import OrderedDict
+import cv2
+import numpy as np
+
+class BackgroundCache:
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._sources = {}
+        self._scaled = OrderedDict()
+
+    def _source(self, path):
+        # File tema hanya dibaca dari disk sekali
+        if path not in self._sources:
+            self._sources[path] = cv2.imread(path)
+        return self._sources[path]
+
+    def get(self, path, size):
+        key = (path, size)
+        background = self._scaled.get(key)
+        if background is not None:
+            self._scaled.move_to_end(key)
+            return background
+
+        source = self._source(path)
+        width, height = size
+        if source is None:
+            background = 255 * np.ones((height, width, 3), dtype=np.uint8)
+        else:
+            background = cv2.resize(source, size)
+        background.setflags(write=False)
+
+        self._scaled[key] = background
+        if len(self._scaled) > self.max_entries:
+            self._scaled.popitem(last=False)
+        return background
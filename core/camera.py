@@ -0,0 +1,107 @@
+import threading
+import time
+from core.frame_source import open_source
+
+class CameraStream:
+    def __init__(self, source=0, width=1280, height=720, realtime=True, loop=False):
+        # source: index webcam, file video, folder/glob gambar, "synthetic" atau FrameSource
+        self.source = open_source(source, width, height, realtime, loop)
+
+        # Slot tunggal: hanya frame terbaru yang disimpan
+        self._lock = threading.Lock()
+        self._frame = None
+        self._timestamp = 0.0
+        self._seq = 0
+        self._read_seq = 0
+
+        self.captured_frames = 0
+        self.dropped_frames = 0
+        self.duplicated_frames = 0
+
+        self._resolution = None
+
+        # Sumber non-realtime (file/synthetic) berjalan lockstep dengan pembaca:
+        # frame berikutnya baru diambil setelah frame sebelumnya dibaca
+        self.lockstep = not getattr(self.source, "realtime", True)
+        self._consumed = threading.Event()
+        self._consumed.set()
+
+        self._running = False
+        self._active = threading.Event()
+        self._active.set()
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        while self._running:
+            if not self._active.wait(0.1):
+                continue
+            if self.lockstep and not self._consumed.wait(0.1):
+                continue
+            if self._resolution is not None:
+                # Hanya diubah dari thread yang membaca kamera
+                width, height = self._resolution
+                self._resolution = None
+                self.source.set_resolution(width, height)
+            success, frame = self.source.read()
+            if not success:
+                if self.source.finished:
+                    break
+                time.sleep(0.05)
+                continue
+            timestamp = time.time()
+            with self._lock:
+                if self._seq != self._read_seq:
+                    self.dropped_frames += 1
+                self._frame = frame
+                self._timestamp = timestamp
+                self._seq += 1
+                self.captured_frames += 1
+                self._consumed.clear()
+
+    def set_resolution(self, width, height):
+        self._resolution = (width, height)
+
+    def pause(self):
+        # Kamera tetap terbuka, hanya berhenti membaca frame
+        self._active.clear()
+
+    def resume(self):
+        with self._lock:
+            self._read_seq = self._seq
+        self._consumed.set()
+        self._active.set()
+
+    def read(self):
+        with self._lock:
+            if self._frame is None:
+                return False, None, 0.0
+            if self._seq == self._read_seq:
+                self.duplicated_frames += 1
+                return False, None, self._timestamp
+            self._read_seq = self._seq
+            self._consumed.set()
+            return True, self._frame, self._timestamp
+
+    def stats(self):
+        return {
+            "captured": self.captured_frames,
+            "dropped": self.dropped_frames,
+            "duplicated": self.duplicated_frames,
+            "finished": self.source.finished,
+        }
+
+    def release(self):
+        self._running = False
+        self._consumed.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.source.release()
@@ -0,0 +1,53 @@
+import numpy as np
+
+# Radius hitbox relatif terhadap ukuran sprite (gambar punya margin transparan)
+HITBOX_RATIO = 0.45
+
+def fruit_circles(pool, slots):
+    half = pool.size[slots].astype(np.float32) * 0.5
+    cx = pool.x[slots] + half
+    cy = pool.y[slots] + half
+    return cx, cy, pool.size[slots] * np.float32(HITBOX_RATIO)
+
+def segment_hits(start, end, cx, cy, r):
+    x0, y0 = start
+    x1, y1 = end
+    dx, dy = float(x1 - x0), float(y1 - y0)
+    len2 = dx * dx + dy * dy
+
+    fx = cx - x0
+    fy = cy - y0
+    if len2 > 0:
+        proj = (fx * dx + fy * dy) / len2
+        closest = np.clip(proj, 0.0, 1.0)
+    else:
+        proj = closest = np.zeros_like(cx)
+
+    ex = fx - closest * dx
+    ey = fy - closest * dy
+    hit = ex * ex + ey * ey <= r * r
+
+    # Titik masuk pertama ke lingkaran di sepanjang segmen (0..1)
+    if len2 > 0:
+        c = fx * fx + fy * fy - r * r
+        disc = np.maximum(proj * proj - c / len2, 0.0)
+        t = np.clip(proj - np.sqrt(disc), 0.0, 1.0)
+    else:
+        t = proj
+    return hit, t
+
+def slice_segment(pool, start, end, grid=None):
+    if grid is not None and grid.indexed:
+        # Broadphase (banyak buah): hanya buah di sel yang dilewati segmen
+        slots = grid.query_segment(start, end)
+        slots = slots[pool.alive[slots] & ~pool.cut[slots]]
+    else:
+        slots = pool.live_slots()
+    if len(slots) == 0:
+        return slots, np.zeros(0, dtype=np.float32)
+
+    cx, cy, r = fruit_circles(pool, slots)
+    hit, t = segment_hits(start, end, cx, cy, r)
+    slots, t = slots[hit], t[hit]
+    order = np.argsort(t, kind="stable")
+    return slots[order], t[order]
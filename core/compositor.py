@@ -0,0 +1,54 @@
+import numpy as np
+
+class Sprite:
+    def __init__(self, img):
+        h, w = img.shape[:2]
+        if img.ndim == 3 and img.shape[2] == 4:
+            alpha = img[:, :, 3:4].astype(np.uint16)
+        else:
+            alpha = np.full((h, w, 1), 255, dtype=np.uint16)
+
+        self.image = img
+        self.width = w
+        self.height = h
+
+        # Warna sudah dikali alpha (+127 supaya pembagian 255 membulatkan)
+        self.premul = img[:, :, :3].astype(np.uint16) * alpha + 127
+        self.inv_alpha = 255 - alpha
+        self.mask = alpha[:, :, 0] > 0
+        self.opaque = bool((alpha == 255).all())
+
+        for arr in (self.image, self.premul, self.inv_alpha, self.mask):
+            arr.setflags(write=False)
+
+
+class Compositor:
+    def __init__(self):
+        self._scratch = np.empty(0, dtype=np.uint16)
+
+    def blit(self, bg, sprite, x, y):
+        bh, bw = bg.shape[:2]
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + sprite.width, bw), min(y + sprite.height, bh)
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        w, h = x1 - x0, y1 - y0
+        sx, sy = x0 - x, y0 - y
+        dst = bg[y0:y1, x0:x1]
+
+        if sprite.opaque:
+            dst[:] = sprite.image[sy:sy + h, sx:sx + w, :3]
+            return (x0, y0, w, h)
+
+        n = h * w * 3
+        if self._scratch.size < n:
+            self._scratch = np.empty(n, dtype=np.uint16)
+        buf = self._scratch[:n].reshape(h, w, 3)
+
+        # dst = (src * a + dst * (255 - a)) / 255, semua kanal sekaligus
+        np.multiply(dst, sprite.inv_alpha[sy:sy + h, sx:sx + w], out=buf)
+        np.add(buf, sprite.premul[sy:sy + h, sx:sx + w], out=buf)
+        np.floor_divide(buf, 255, out=buf)
+        np.copyto(dst, buf, casting="unsafe")
+        return (x0, y0, w, h)
@@ -1,83 +1,41 @@
 import os
-from openpyxl import Workbook, load_workbook
-from datetime import datetime
+import sys
+from openpyxl import Workbook
+from core.results_store import ResultsStore
 
 class GameDataSaver:
-    def __init__(self, filename="game_data.xlsx"):
+    SHEETS = (
+        ("Multiplayer", "multiplayer", ["Tanggal", "Player1", "Player2", "Level", "Pemenang", "HighScore"]),
+        ("Soloplayer", "solo", ["Tanggal", "Score", "Missed", "Level"]),
+    )
+
+    def __init__(self, filename="game_data_export.xlsx"):
         self.filename = filename
 
         folder = os.path.dirname(self.filename)
         if folder:
             os.makedirs(folder, exist_ok=True)
 
-    def _get_sheet(self, sheet_name, header):
-        if not os.path.exists(self.filename):
-            wb = Workbook()
-            ws = wb.active
-            ws.title = sheet_name
-            ws.append(header)
-            wb.save(self.filename)
-
-        wb = load_workbook(self.filename)
-        if sheet_name not in wb.sheetnames:
+    def export(self, store):
+        # Ekspor sekali jalan: baris sudah urut dari indeks skor di database
+        store.flush()
+        wb = Workbook(write_only=True)
+        for sheet_name, mode, header in self.SHEETS:
             ws = wb.create_sheet(sheet_name)
             ws.append(header)
-        else:
-            ws = wb[sheet_name]
-
-        return wb, ws
-
-    def save_multiplayer(self, player1, player2, level):
-        sheet_name = "Multiplayer"
-        header = ["Tanggal", "Player1", "Player2", "Level", "Pemenang", "HighScore"]
-
-        wb, ws = self._get_sheet(sheet_name, header)
-
-        if player1 > player2:
-            winner = "Player1"
-        elif player2 > player1:
-            winner = "Player2"
-        else:
-            winner = "Draw"
-
-        highscore = max(player1, player2)
-
-        ws.append([
-            datetime.now().strftime("%Y-%m-%d %H:%M"),
-            player1,
-            player2,
-            level,
-            winner,
-            highscore
-        ])
-
-        rows = list(ws.iter_rows(values_only=True))[1:]
-        rows.sort(key=lambda r: r[5], reverse=True)
-
-        ws.delete_rows(2, ws.max_row)
-        for r in rows:
-            ws.append(r)
-
+            for row in store.rows(mode):
+                ws.append(list(row))
         wb.save(self.filename)
 
-    def save_solo(self, score, missed, level):
-        sheet_name = "Soloplayer"
-        header = ["Tanggal", "Score", "Missed", "Level"]
 
-        wb, ws = self._get_sheet(sheet_name, header)
+if __name__ == "__main__":
+    db_file = sys.argv[1] if len(sys.argv) > 1 else "game_data.db"
+    xlsx_file = sys.argv[2] if len(sys.argv) > 2 else "game_data_export.xlsx"
+    if os.path.abspath(xlsx_file) == os.path.abspath("game_data.xlsx"):
+        # File lama adalah sumber riwayat; jangan ditimpa
+        sys.exit("game_data.xlsx berisi riwayat lama, pilih nama file lain")
 
-        ws.append([
-            datetime.now().strftime("%Y-%m-%d %H:%M"),
-            score,
-            missed,
-            level
-        ])
-
-        rows = list(ws.iter_rows(values_only=True))[1:]
-        rows.sort(key=lambda r: r[1], reverse=True)
-
-        ws.delete_rows(2, ws.max_row)
-        for r in rows:
-            ws.append(r)
-
-        wb.save(self.filename)
+    store = ResultsStore(db_file)
+    GameDataSaver(xlsx_file).export(store)
+    store.close()
+    print(f"Data diekspor ke {xlsx_file}")
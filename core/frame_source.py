@@ -0,0 +1,159 @@
+import glob
+import os
+import time
+import cv2
+import numpy as np
+
+class FrameSource:
+    # read() -> (success, frame BGR); finished=True kalau sumber sudah habis
+    finished = False
+
+    def read(self):
+        raise NotImplementedError
+
+    def set_resolution(self, width, height):
+        pass
+
+    def release(self):
+        pass
+
+
+class WebcamSource(FrameSource):
+    def __init__(self, index=0, width=1280, height=720):
+        self.cap = cv2.VideoCapture(index)
+        self.set_resolution(width, height)
+
+    def read(self):
+        return self.cap.read()
+
+    def set_resolution(self, width, height):
+        self.cap.set(3, width)
+        self.cap.set(4, height)
+
+    def release(self):
+        self.cap.release()
+
+
+class PacedSource(FrameSource):
+    # realtime=True: frame keluar sesuai fps; False: secepat mungkin
+    def __init__(self, fps=30.0, realtime=True, loop=False):
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self.index = 0
+        self._start = None
+
+    def _pace(self):
+        if not self.realtime:
+            return
+        now = time.perf_counter()
+        if self._start is None:
+            self._start = now
+        delay = self._start + self.index / self.fps - now
+        if delay > 0:
+            time.sleep(delay)
+        elif delay < -1.0:
+            # Tertinggal jauh (mis. dijeda): mulai hitung ulang dari sekarang
+            self._start = now - self.index / self.fps
+
+    def read(self):
+        self._pace()
+        success, frame = self._next()
+        if not success and self.loop and self.index > 0:
+            self._rewind()
+            success, frame = self._next()
+        if not success:
+            self.finished = True
+            return False, None
+        self.index += 1
+        return True, frame
+
+    def _next(self):
+        raise NotImplementedError
+
+    def _rewind(self):
+        raise NotImplementedError
+
+
+class VideoFileSource(PacedSource):
+    def __init__(self, path, realtime=True, loop=False):
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise Exception(f"Video tidak bisa dibuka: {path}")
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        super().__init__(fps if fps and fps > 0 else 30.0, realtime, loop)
+
+    def _next(self):
+        return self.cap.read()
+
+    def _rewind(self):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        self.cap.release()
+
+
+class ImageSequenceSource(PacedSource):
+    EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+    def __init__(self, pattern, fps=30.0, realtime=True, loop=False):
+        if os.path.isdir(pattern):
+            paths = [os.path.join(pattern, f) for f in os.listdir(pattern)]
+        else:
+            paths = glob.glob(pattern)
+        self.paths = sorted(p for p in paths if p.lower().endswith(self.EXTENSIONS))
+        if not self.paths:
+            raise Exception(f"Tidak ada gambar untuk '{pattern}'!")
+        self._cursor = 0
+        super().__init__(fps, realtime, loop)
+
+    def _next(self):
+        if self._cursor >= len(self.paths):
+            return False, None
+        frame = cv2.imread(self.paths[self._cursor])
+        self._cursor += 1
+        return frame is not None, frame
+
+    def _rewind(self):
+        self._cursor = 0
+
+
+class SyntheticSource(PacedSource):
+    # Pola bergerak tanpa file: gradien + lingkaran yang menyapu layar
+    def __init__(self, width=640, height=360, fps=30.0, realtime=True, frames=None):
+        super().__init__(fps, realtime, loop=False)
+        self.frames = frames
+        self.set_resolution(width, height)
+
+    def set_resolution(self, width, height):
+        self.width = width
+        self.height = height
+        ramp = np.linspace(40, 200, width, dtype=np.float32)
+        self._base = np.empty((height, width, 3), dtype=np.uint8)
+        self._base[:] = ramp[None, :, None].astype(np.uint8)
+
+    def _next(self):
+        if self.frames is not None and self.index >= self.frames:
+            return False, None
+        t = self.index / self.fps
+        frame = self._base.copy()
+        cx = int(self.width * (0.5 + 0.4 * np.sin(t * 2.2)))
+        cy = int(self.height * (0.5 + 0.3 * np.sin(t * 1.3)))
+        cv2.circle(frame, (cx, cy), max(4, self.height // 12), (90, 140, 220), -1)
+        return True, frame
+
+    def _rewind(self):
+        pass
+
+
+def open_source(spec=0, width=1280, height=720, realtime=True, loop=False):
+    # spec: index webcam, "synthetic", folder/glob gambar, atau file video
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or str(spec).isdigit():
+        return WebcamSource(int(spec), width, height)
+    if spec == "synthetic":
+        return SyntheticSource(width, height, realtime=realtime)
+    if os.path.isdir(spec) or any(c in spec for c in "*?["):
+        return ImageSequenceSource(spec, realtime=realtime, loop=loop)
+    return VideoFileSource(spec, realtime=realtime, loop=loop)
@@ -1,11 +1,12 @@
-import random
-import cv2
-import os
+import numpy as np
+from core.sprite_atlas import SpriteAtlas
 
 class Fruit:
-    def __init__(self, img, is_bomb, x, y, vy):
-        self.img = img
-        self.is_bomb = is_bomb
+    def __init__(self, entry, x, y, vy):
+        self.entry = entry
+        self.sprite = entry.sprite
+        self.img = entry.sprite.image
+        self.is_bomb = entry.is_bomb
         self.x = x
         self.y = y
         self.vy = vy
@@ -13,69 +14,157 @@ class Fruit:
         self.cut = False
         self.counted = False
 
+class FruitPool:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.sprite_id = np.zeros(capacity, dtype=np.int32)
+        self.is_bomb = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.cut = np.zeros(capacity, dtype=bool)
+        self.counted = np.zeros(capacity, dtype=bool)
+
+    def activate(self, count):
+        # Slot baru dimulai kosong, diisi lewat spawn()
+        self.count = max(self.count, min(count, self.capacity))
+
+    def spawn(self, slots, sprite_ids, sizes, is_bomb, x, y, vy):
+        self.sprite_id[slots] = sprite_ids
+        self.size[slots] = sizes
+        self.is_bomb[slots] = is_bomb
+        self.x[slots] = x
+        self.y[slots] = y
+        self.prev_y[slots] = y
+        self.vy[slots] = vy
+        self.alive[slots] = True
+        self.cut[slots] = False
+        self.counted[slots] = False
+
+    def step(self, limit):
+        n = self.count
+        alive = self.alive[:n]
+        y = self.y[:n]
+        self.prev_y[:n] = y
+        np.add(y, self.vy[:n], out=y, where=alive)
+
+        fallen = alive & ~self.counted[:n] & (y > limit)
+        alive[fallen] = False
+        self.counted[:n][fallen] = True
+        return fallen
+
+    def free_slots(self):
+        n = self.count
+        return np.flatnonzero(~self.alive[:n] | self.cut[:n])
+
+    def live_slots(self):
+        n = self.count
+        return np.flatnonzero(self.alive[:n] & ~self.cut[:n])
+
+    def draw_list(self, alpha=1.0, scale=1.0):
+        live = self.live_slots()
+        # Interpolasi antara dua langkah simulasi
+        prev_y = self.prev_y[live]
+        y = prev_y + (self.y[live] - prev_y) * alpha
+        return zip(
+            self.sprite_id[live].tolist(),
+            (self.x[live] * scale).astype(np.int32).tolist(),
+            (y * scale).astype(np.int32).tolist(),
+        )
+
 class FruitManager:
-    def __init__(self, width, height, image_folder="assets/images", min_size=70, max_size=120):
+    SPAWN_RETRIES = 4
+
+    def __init__(self, width, height, image_folder="assets/images", min_size=70, max_size=120, atlas=None,
+                 seed=None):
         self.WIDTH = width
         self.HEIGHT = height
         self.min_size = min_size
         self.max_size = max_size
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        # Dipanggil setelah setiap spawn (dipakai perekam replay)
+        self.on_spawn = None
 
-        self.fruit_images = []
-        for f in os.listdir(image_folder):
-            if f.endswith(".png"):
-                self.fruit_images.append({
-                    "img": cv2.imread(os.path.join(image_folder, f), cv2.IMREAD_UNCHANGED),
-                    "is_bomb": "bomb" in f.lower()
-                })
-
-        if not self.fruit_images:
-            raise Exception("Tidak ada file PNG di folder 'images'!")
-
-        self.cache = {}
+        # Atlas dibuat sekali; semua buah memakai sprite yang sama
+        self.atlas = atlas if atlas is not None else SpriteAtlas(image_folder, min_size, max_size)
 
-    def _resize_cached(self, base, size, is_bomb):
-        key = (size, is_bomb)
-        if key not in self.cache:
-            try:
-                self.cache[key] = cv2.resize(base, (size, size))
-            except Exception:
-                self.cache[key] = base.copy()
-        return self.cache[key]
+    def reseed(self, seed):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
 
-    def spawn_fruit_solo(self, level):
-        f = random.choice(self.fruit_images)
-        base = f["img"]
-        size = random.randint(self.min_size, self.max_size)
-        img = self._resize_cached(base, size, f["is_bomb"]).copy()
-
-        x = random.randint(100, self.WIDTH - 150)
-        y = -random.randint(100, 800)
-        vy = random.uniform(6 + level, 9 + level)
-
-        return Fruit(img, f["is_bomb"], x, y, vy)
+    def _random_entry_ids(self, k):
+        fruit_indices = self.rng.integers(0, len(self.atlas.names), k)
+        sizes = self.rng.integers(self.min_size, self.max_size, k, endpoint=True)
+        return self.atlas.entry_ids(fruit_indices, sizes)
 
-    def spawn_fruit_multi(self, level, p1_alive=True, p2_alive=True):
-        import random
-        f = random.choice(self.fruit_images)
-        base = f["img"]
-        size = random.randint(self.min_size, self.max_size)
-        img = self._resize_cached(base, size, f["is_bomb"]).copy()
+    def _solo_params(self, level, k):
+        x = self.rng.integers(100, self.WIDTH - 150, k, endpoint=True)
+        y = -self.rng.integers(100, 800, k, endpoint=True)
+        vy = self.rng.uniform(6 + level, 9 + level, k)
+        return x, y, vy
 
+    def _multi_params(self, level, k, p1_alive, p2_alive):
         left_min = 60
         left_max = max(120, self.WIDTH // 2 - 120)
         right_min = min(self.WIDTH // 2 + 40, self.WIDTH - 300)
         right_max = self.WIDTH - 120
 
+        left = self.rng.integers(left_min, left_max, k, endpoint=True)
+        right = self.rng.integers(right_min, right_max, k, endpoint=True)
         if p1_alive and p2_alive:
-            x = random.randint(left_min, left_max) if random.random() < 0.5 else random.randint(right_min, right_max)
+            x = np.where(self.rng.random(k) < 0.5, left, right)
         elif p1_alive and not p2_alive:
-            x = random.randint(left_min, left_max)
+            x = left
         elif not p1_alive and p2_alive:
-            x = random.randint(right_min, right_max)
+            x = right
         else:
-            x = random.randint(left_min, right_max)
+            x = self.rng.integers(left_min, right_max, k, endpoint=True)
+
+        y = -self.rng.integers(80, 600, k, endpoint=True)
+        vy = self.rng.uniform(5 + level * 0.6, 9 + level * 1.0, k)
+        return x, y, vy
+
+    def _fill(self, pool, slots, make_params, grid):
+        ids = self._random_entry_ids(len(slots))
+        x, y, vy = make_params(len(slots))
+        pool.spawn(slots, ids, self.atlas.entry_sizes[ids], self.atlas.entry_bombs[ids], x, y, vy)
 
-        y = -random.randint(80, 600)
-        vy = random.uniform(5 + level * 0.6, 9 + level * 1.0)
+        if grid is not None:
+            # Hindari spawn yang menumpuk dengan buah lain; yang menumpuk diacak ulang sekaligus
+            retry = slots
+            for _ in range(self.SPAWN_RETRIES):
+                retry = retry[grid.overlapping(pool, retry, slots)]
+                if len(retry) == 0:
+                    break
+                x, y, _ = make_params(len(retry))
+                pool.x[retry] = x
+                pool.y[retry] = y
+            if grid.indexed:
+                grid.update(pool)
 
-        return Fruit(img, f["is_bomb"], x, y, vy)
+        if self.on_spawn is not None:
+            self.on_spawn(slots, pool.sprite_id[slots], pool.x[slots], pool.y[slots], pool.vy[slots])
+
+    def fill_solo(self, pool, slots, level, grid=None):
+        if len(slots):
+            self._fill(pool, slots, lambda k: self._solo_params(level, k), grid)
+
+    def fill_multi(self, pool, slots, level, p1_alive=True, p2_alive=True, grid=None):
+        if len(slots):
+            self._fill(pool, slots, lambda k: self._multi_params(level, k, p1_alive, p2_alive), grid)
+
+    def spawn_fruit_solo(self, level):
+        sprite_id = self._random_entry_ids(1)[0]
+        x, y, vy = self._solo_params(level, 1)
+        return Fruit(self.atlas.entries[sprite_id], int(x[0]), int(y[0]), float(vy[0]))
+
+    def spawn_fruit_multi(self, level, p1_alive=True, p2_alive=True):
+        sprite_id = self._random_entry_ids(1)[0]
+        x, y, vy = self._multi_params(level, 1, p1_alive, p2_alive)
+        return Fruit(self.atlas.entries[sprite_id], int(x[0]), int(y[0]), float(vy[0]))
@@ -1,18 +1,262 @@
+import threading
+import time
 import cv2
-import mediapipe as mp
+import numpy as np
 
 class HandTracker:
-    def __init__(self, max_hands=1, det_conf=0.4, track_conf=0.4):
+    def __init__(self, max_hands=1, det_conf=0.4, track_conf=0.4, roi_tracking=True, roi_size=192,
+                 roi_margin=0.5, redetect_every=15):
+        import mediapipe as mp
+
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            max_num_hands=max_hands,
-            min_detection_confidence=det_conf,
-            min_tracking_confidence=track_conf
-        )
+        self.options = dict(min_detection_confidence=det_conf, min_tracking_confidence=track_conf)
+        self.hands = self.mp_hands.Hands(max_num_hands=max_hands, **self.options)
+        self.max_hands = max_hands
+
+        # Mode ROI: setelah tangan ketemu, hanya area di sekitar tangan yang diproses
+        self.roi_tracking = roi_tracking
+        self.roi_size = roi_size
+        self.roi_margin = roi_margin
+        self.redetect_every = redetect_every
+        self.rois = []
+        self._roi_frame_size = None
+        self._roi_hands = []
+        self._since_full = 0
+        self.full_frames = 0
+        self.roi_frames = 0
+
+    def process(self, frame_bgr, max_width=None):
+        h, w = frame_bgr.shape[:2]
+        if (w, h) != self._roi_frame_size:
+            # Resolusi kamera berubah: ROI lama tidak berlaku
+            self._roi_frame_size = (w, h)
+            self.rois = []
+        if self.roi_tracking and self.rois:
+            # Saat belum semua tangan ketemu, deteksi penuh lebih sering
+            limit = self.redetect_every if len(self.rois) == self.max_hands else max(1, self.redetect_every // 3)
+            if self._since_full < limit:
+                hands = self._process_rois(frame_bgr, w, h)
+                if hands is not None:
+                    self._since_full += 1
+                    self.roi_frames += 1
+                    return HandResult(hands)
+
+        # Deteksi penuh: pertama kali, tangan hilang, atau jadwal deteksi ulang
+        full = frame_bgr
+        if max_width is not None and w > max_width:
+            full = cv2.resize(frame_bgr, (max_width, int(round(h * max_width / w))), interpolation=cv2.INTER_AREA)
+        result = self.hands.process(cv2.cvtColor(full, cv2.COLOR_BGR2RGB))
+        self._since_full = 0
+        self.full_frames += 1
+
+        hands = result.multi_hand_landmarks or []
+        self.rois = [self._bbox(hand, w, h) for hand in hands] if self.roi_tracking else []
+        return result
+
+    def reset(self):
+        # Match baru: mulai lagi dari deteksi penuh
+        self.rois = []
+        self._since_full = 0
+
+    def _roi_tracker(self, i):
+        while len(self._roi_hands) <= i:
+            self._roi_hands.append(self.mp_hands.Hands(max_num_hands=1, **self.options))
+        return self._roi_hands[i]
+
+    def _process_rois(self, frame_bgr, w, h):
+        hands = []
+        rois = []
+        for i, (x0, y0, x1, y1) in enumerate(self.rois):
+            crop = frame_bgr[y0:y1, x0:x1]
+            cw, ch = x1 - x0, y1 - y0
+            scale = self.roi_size / max(cw, ch)
+            if scale < 1.0:
+                crop = cv2.resize(crop, (max(1, int(cw * scale)), max(1, int(ch * scale))),
+                                  interpolation=cv2.INTER_AREA)
+            result = self._roi_tracker(i).process(cv2.cvtColor(crop, cv2.COLOR_BGR2RGB))
+            if not result.multi_hand_landmarks:
+                return None
+
+            # Koordinat crop (0..1) dikembalikan ke koordinat frame penuh, lalu
+            # dibulatkan ke float32 seperti keluaran MediaPipe dan file replay
+            points = np.array([(lm.x, lm.y, lm.z) for lm in result.multi_hand_landmarks[0].landmark])
+            points[:, 0] = (x0 + points[:, 0] * cw) / w
+            points[:, 1] = (y0 + points[:, 1] * ch) / h
+            hand = HandLandmarks([Landmark(float(x), float(y), float(z))
+                                  for x, y, z in points.astype(np.float32)])
+            hands.append(hand)
+            rois.append(self._bbox(hand, w, h))
+
+        # Dua ROI menumpuk: kemungkinan mengikuti tangan yang sama
+        if len(rois) == 2 and self._overlap(rois[0], rois[1]) > 0.5:
+            return None
+        self.rois = rois
+        return hands
+
+    def _bbox(self, hand, w, h):
+        xs = [lm.x * w for lm in hand.landmark]
+        ys = [lm.y * h for lm in hand.landmark]
+        cx, cy = (min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2
+        side = max(max(xs) - min(xs), max(ys) - min(ys), 32) * (1 + 2 * self.roi_margin)
+        half = min(side, w, h) / 2
+        cx = min(max(cx, half), w - half)
+        cy = min(max(cy, half), h - half)
+        return (int(cx - half), int(cy - half), int(cx + half), int(cy + half))
 
-    def process(self, frame_bgr):
-        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        return self.hands.process(rgb)
+    def _overlap(self, a, b):
+        ix = max(0, min(a[2], b[2]) - max(a[0], b[0]))
+        iy = max(0, min(a[3], b[3]) - max(a[1], b[1]))
+        smaller = min((a[2] - a[0]) * (a[3] - a[1]), (b[2] - b[0]) * (b[3] - b[1]))
+        return ix * iy / smaller if smaller else 0.0
+
+    def warm_up(self, width=320, height=240):
+        # Semua model (penuh dan ROI) dimuat sebelum game dimulai
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        self.hands.process(blank)
+        if self.roi_tracking:
+            crop = np.zeros((self.roi_size, self.roi_size, 3), dtype=np.uint8)
+            for i in range(self.max_hands):
+                self._roi_tracker(i).process(crop)
 
     def close(self):
         self.hands.close()
+        for hands in self._roi_hands:
+            hands.close()
+
+
+class Landmark:
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class HandLandmarks:
+    def __init__(self, landmark):
+        self.landmark = landmark
+
+
+class HandResult:
+    # Bentuk yang sama dengan hasil MediaPipe (multi_hand_landmarks[i].landmark[j])
+    def __init__(self, multi_hand_landmarks=None):
+        self.multi_hand_landmarks = multi_hand_landmarks or None
+
+    @classmethod
+    def from_points(cls, points):
+        hands = [HandLandmarks([Landmark(x, y) for _ in range(21)]) for x, y in points]
+        return cls(hands)
+
+
+class TrackingResult:
+    def __init__(self, result, timestamp, seq, process_ms=0.0):
+        self.result = result
+        self.timestamp = timestamp
+        self.seq = seq
+        self.process_ms = process_ms
+
+    def age(self, now):
+        return now - self.timestamp
+
+
+class AsyncHandTracker:
+    def __init__(self, max_hands=1, det_conf=0.4, track_conf=0.4, process_size=None, roi_tracking=True):
+        self.tracker = HandTracker(max_hands, det_conf, track_conf, roi_tracking=roi_tracking)
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending = None
+        self._latest = None
+        self._seq = 0
+        # Naik setiap reset(); hasil dari frame sebelum reset dibuang
+        self._generation = 0
+        self.skipped_frames = 0
+        # Lebar maksimum frame untuk deteksi penuh; landmark tetap ternormalisasi
+        self.process_size = process_size
+
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame_bgr, timestamp):
+        with self._lock:
+            if self._pending is not None:
+                self.skipped_frames += 1
+            self._pending = (frame_bgr, timestamp, self._generation)
+        self._wake.set()
+
+    def warm_up(self, width=320, height=240):
+        # Inferensi pertama memuat model; lakukan sebelum game dimulai
+        self.tracker.warm_up(width, height)
+
+    def latest(self):
+        with self._lock:
+            return self._latest
+
+    def reset(self):
+        with self._lock:
+            self._pending = None
+            self._latest = None
+            self._seq = 0
+            self._generation += 1
+
+    def _worker(self):
+        # ROI hanya diubah dari thread ini
+        generation = 0
+        while self._running:
+            self._wake.wait(0.1)
+            self._wake.clear()
+            with self._lock:
+                job = self._pending
+                self._pending = None
+            if job is None:
+                continue
+
+            frame_bgr, timestamp, job_generation = job
+            if job_generation != generation:
+                generation = job_generation
+                self.tracker.reset()
+            start = time.perf_counter()
+            max_width = self.process_size[0] if self.process_size is not None else None
+            result = self.tracker.process(frame_bgr, max_width)
+            process_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                if job_generation != self._generation:
+                    continue
+                self._seq += 1
+                self._latest = TrackingResult(result, timestamp, self._seq, process_ms)
+
+    def close(self):
+        self._running = False
+        self._wake.set()
+        self._thread.join(timeout=1.0)
+        self.tracker.close()
+
+
+class ScriptedHandTracker:
+    def __init__(self):
+        self._latest = None
+        self._seq = 0
+        self.process_size = None
+
+    def push(self, timestamp, points):
+        self.push_result(timestamp, HandResult.from_points(points))
+
+    def push_result(self, timestamp, result):
+        self._seq += 1
+        self._latest = TrackingResult(result, timestamp, self._seq)
+
+    def submit(self, frame_bgr, timestamp):
+        pass
+
+    def warm_up(self, width=320, height=240):
+        pass
+
+    def latest(self):
+        return self._latest
+
+    def reset(self):
+        self._latest = None
+        self._seq = 0
+
+    def close(self):
+        pass
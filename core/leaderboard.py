@@ -0,0 +1,81 @@
+import sqlite3
+from datetime import date, datetime
+from core.results_store import COLUMNS, SCORE_COLUMN
+
+def _date_key(value):
+    # Kolom tanggal disimpan sebagai "YYYY-MM-DD HH:MM" sehingga bisa dibandingkan sebagai teks
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d 00:00")
+    return str(value)
+
+class Leaderboard:
+    def __init__(self, store):
+        self.store = store
+        self._conn = None
+
+    def _db(self):
+        if self.store is None:
+            # Mis. runtime headless tanpa database
+            raise sqlite3.OperationalError("Leaderboard tanpa database")
+        if self._conn is None:
+            self._conn = self.store.connect()
+        return self._conn
+
+    def _where(self, level=None, since=None, until=None, extra=None):
+        clauses = []
+        params = []
+        if level is not None:
+            clauses.append("level = ?")
+            params.append(level)
+        if since is not None:
+            clauses.append("tanggal >= ?")
+            params.append(_date_key(since))
+        if until is not None:
+            clauses.append("tanggal < ?")
+            params.append(_date_key(until))
+        if extra is not None:
+            clauses.append(extra[0])
+            params.append(extra[1])
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def _rows(self, mode, sql, params):
+        cols = COLUMNS[mode]
+        return [dict(zip(cols, row)) for row in self._db().execute(sql, params)]
+
+    def top(self, mode, k=10, level=None, since=None, until=None, offset=0):
+        where, params = self._where(level, since, until)
+        sql = (f"SELECT {', '.join(COLUMNS[mode])} FROM {mode}{where} "
+               f"ORDER BY {SCORE_COLUMN[mode]} DESC, id LIMIT ? OFFSET ?")
+        return self._rows(mode, sql, params + [k, offset])
+
+    def recent(self, mode, k=10, level=None, offset=0):
+        where, params = self._where(level)
+        sql = (f"SELECT {', '.join(COLUMNS[mode])} FROM {mode}{where} "
+               f"ORDER BY tanggal DESC, id DESC LIMIT ? OFFSET ?")
+        return self._rows(mode, sql, params + [k, offset])
+
+    def count(self, mode, level=None, since=None, until=None):
+        where, params = self._where(level, since, until)
+        return self._db().execute(f"SELECT COUNT(*) FROM {mode}{where}", params).fetchone()[0]
+
+    def rank(self, mode, score, level=None):
+        where, params = self._where(level, extra=(f"{SCORE_COLUMN[mode]} > ?", score))
+        higher = self._db().execute(f"SELECT COUNT(*) FROM {mode}{where}", params).fetchone()[0]
+        return higher + 1
+
+    def best(self, mode, level=None):
+        where, params = self._where(level)
+        best = self._db().execute(f"SELECT MAX({SCORE_COLUMN[mode]}) FROM {mode}{where}", params).fetchone()[0]
+        return best if best is not None else 0
+
+    def best_per_level(self, mode):
+        sql = f"SELECT level, MAX({SCORE_COLUMN[mode]}) FROM {mode} GROUP BY level ORDER BY level"
+        return dict(self._db().execute(sql).fetchall())
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
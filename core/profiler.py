@@ -0,0 +1,130 @@
+import json
+import logging
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+class NullProfiler:
+    # Dipakai saat profiling mati: setiap panggilan langsung kembali
+    active = False
+
+    def begin_frame(self):
+        pass
+
+    def mark(self, stage):
+        pass
+
+    def record(self, stage, ms, within=None):
+        pass
+
+    def end_frame(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class FrameProfiler:
+    def __init__(self, window=300, log_path=None, max_bytes=5 * 1024 * 1024, backups=3, always_on=False):
+        self.window = window
+        self.history = {}
+        self.show_hud = False
+        # Tetap merekam tanpa HUD/log (dipakai benchmark)
+        self.always_on = always_on
+        self.frame = 0
+        self._samples = {}
+        self._start = self._last = 0.0
+
+        self._hud_font = None
+        self._hud_lines = []
+        self._hud_frame = -1
+
+        self.logger = None
+        self._handler = None
+        if log_path:
+            # Satu baris JSON per frame, file diputar supaya tidak membengkak
+            self._handler = RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backups)
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+            self.logger = logging.getLogger("ninja.frames")
+            self.logger.setLevel(logging.INFO)
+            self.logger.propagate = False
+            self.logger.addHandler(self._handler)
+
+    @property
+    def active(self):
+        return self.show_hud or self.always_on or self.logger is not None
+
+    def toggle_hud(self):
+        self.show_hud = not self.show_hud
+        return self.show_hud
+
+    def begin_frame(self):
+        self._samples = {}
+        self._start = self._last = time.perf_counter()
+
+    def mark(self, stage):
+        # Waktu sejak mark sebelumnya dihitung untuk stage ini
+        now = time.perf_counter()
+        self._samples[stage] = self._samples.get(stage, 0.0) + (now - self._last) * 1000
+        self._last = now
+
+    def record(self, stage, ms, within=None):
+        # Untuk stage yang berjalan di thread lain (mis. inferensi MediaPipe).
+        # within: stage yang sudah ikut menghitung waktu ini, dikurangi di sana
+        self._samples[stage] = ms
+        if within in self._samples:
+            self._samples[within] -= ms
+
+    def end_frame(self):
+        samples = self._samples
+        samples["total"] = (time.perf_counter() - self._start) * 1000
+        for stage, ms in samples.items():
+            values = self.history.get(stage)
+            if values is None:
+                values = self.history[stage] = deque(maxlen=self.window)
+            values.append(ms)
+        self.frame += 1
+
+        if self.logger is not None:
+            self.logger.info(json.dumps({
+                "frame": self.frame,
+                "time": round(time.time(), 4),
+                "ms": {stage: round(ms, 3) for stage, ms in samples.items()},
+            }))
+
+    def percentiles(self):
+        stats = {}
+        for stage, values in self.history.items():
+            ordered = sorted(values)
+            n = len(ordered) - 1
+            stats[stage] = tuple(ordered[int(n * q)] for q in (0.5, 0.95, 0.99))
+        return stats
+
+    def draw(self, surface, pos=(10, 10), every=15):
+        if self._hud_font is None:
+            import pygame
+            self._hud_font = pygame.font.SysFont("monospace", 16)
+        font = self._hud_font
+
+        # Teks HUD hanya dirender ulang tiap beberapa frame
+        if self.frame - self._hud_frame >= every or not self._hud_lines:
+            self._hud_frame = self.frame
+            lines = ["stage          p50    p95    p99"]
+            for stage, (p50, p95, p99) in self.percentiles().items():
+                lines.append(f"{stage:<12} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+            self._hud_lines = [font.render(line, True, (255, 255, 0), (0, 0, 0)) for line in lines]
+
+        x, y = pos
+        width = 0
+        for text in self._hud_lines:
+            surface.blit(text, (x, y))
+            y += text.get_height()
+            width = max(width, text.get_width())
+        return (pos[0], pos[1], width, y - pos[1])
+
+    def close(self):
+        if self._handler is not None:
+            self.logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+            self.logger = None
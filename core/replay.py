@@ -0,0 +1,180 @@
+import json
+import os
+import struct
+import time
+import numpy as np
+from core.hand_tracker import HandLandmarks, HandResult, Landmark
+
+# Format file replay (.njr), little-endian:
+#   header : magic "NJR1", versi u8, mode u8, seed i64, mulai f64, lebar u16, tinggi u16
+#   record : jenis u8, waktu f64, lalu isi sesuai jenis
+# Waktu disimpan apa adanya (time.time()) supaya langkah simulasi saat
+# diputar ulang sama persis dengan sesi aslinya.
+MAGIC = b"NJR1"
+VERSION = 2
+HEADER = struct.Struct("<4sBBqdHH")
+RECORD = struct.Struct("<Bd")
+TRACK = struct.Struct("<dIB")
+COUNT = struct.Struct("<I")
+SIZE = struct.Struct("<HH")
+
+FRAME = 1
+TRACK_RESULT = 2
+SPAWN = 3
+END = 4
+RESIZE = 5
+
+MODES = {"solo": 1, "multi": 2}
+MODE_NAMES = {v: k for k, v in MODES.items()}
+
+LANDMARKS = 21
+SPAWN_DTYPE = np.dtype([
+    ("slot", "<u2"), ("sprite_id", "<u2"), ("x", "<f4"), ("y", "<f4"), ("vy", "<f4"),
+])
+
+
+class ReplayWriter:
+    def __init__(self, path, mode, seed, start, width, height):
+        self.path = path
+        self.start = start
+        self.now = start
+        self._size = None
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, MODES[mode], seed, start, width, height))
+
+    def resize(self, width, height):
+        # Window diubah sebelum simulasi frame berikutnya; ditulis setelah record FRAME-nya
+        self._size = (width, height)
+
+    def frame(self, now):
+        self.now = now
+        self.file.write(RECORD.pack(FRAME, self.now))
+        if self._size is not None:
+            self.file.write(RECORD.pack(RESIZE, self.now))
+            self.file.write(SIZE.pack(*self._size))
+            self._size = None
+
+    def track(self, tracked):
+        hands = tracked.result.multi_hand_landmarks or []
+        self.file.write(RECORD.pack(TRACK_RESULT, self.now))
+        self.file.write(TRACK.pack(tracked.timestamp, tracked.seq, len(hands)))
+        for hand in hands:
+            points = np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark], dtype="<f4")
+            self.file.write(points.tobytes())
+
+    def spawn(self, slots, sprite_ids, x, y, vy):
+        items = np.empty(len(slots), dtype=SPAWN_DTYPE)
+        items["slot"] = slots
+        items["sprite_id"] = sprite_ids
+        items["x"] = x
+        items["y"] = y
+        items["vy"] = vy
+        self.file.write(RECORD.pack(SPAWN, self.now))
+        self.file.write(COUNT.pack(len(items)))
+        self.file.write(items.tobytes())
+
+    def end(self, summary):
+        data = json.dumps(summary).encode("utf-8")
+        self.file.write(RECORD.pack(END, self.now))
+        self.file.write(COUNT.pack(len(data)))
+        self.file.write(data)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+
+class SessionRecorder:
+    # Merekam tiap sesi game ke record_dir (NINJA_RECORD_DIR); tanpa record_dir
+    # semua method tidak melakukan apa-apa
+    def __init__(self, mode, record_dir, summary):
+        self.mode = mode
+        self.record_dir = record_dir
+        # summary() -> skor akhir sesi, ditulis di record END
+        self.summary = summary
+        self.writer = None
+        self.fruit_manager = None
+
+    def restart(self, fruit_manager, width, height):
+        self.stop()
+        if not self.record_dir:
+            return
+        seed = int(np.random.SeedSequence().entropy % (2 ** 63))
+        fruit_manager.reseed(seed)
+        os.makedirs(self.record_dir, exist_ok=True)
+        name = f"{self.mode}_{time.strftime('%Y%m%d_%H%M%S')}_{seed % 10000:04d}.njr"
+        self.writer = ReplayWriter(os.path.join(self.record_dir, name), self.mode, seed, time.time(),
+                                   width, height)
+        self.fruit_manager = fruit_manager
+        fruit_manager.on_spawn = self.writer.spawn
+
+    def frame(self, now):
+        if self.writer is not None:
+            self.writer.frame(now)
+
+    def track(self, tracked):
+        if self.writer is not None:
+            self.writer.track(tracked)
+
+    def resize(self, width, height):
+        if self.writer is not None:
+            self.writer.resize(width, height)
+
+    def stop(self):
+        if self.writer is None:
+            return
+        self.writer.end(self.summary())
+        self.writer.close()
+        self.fruit_manager.on_spawn = None
+        print(f"Replay disimpan: {self.writer.path}")
+        self.writer = None
+        self.fruit_manager = None
+
+
+class ReplayReader:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = f.read()
+        magic, version = struct.unpack_from("<4sB", self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Bukan file replay yang dikenal: {path}")
+        _, _, mode, seed, start, width, height = HEADER.unpack_from(self.data, 0)
+        self.mode = MODE_NAMES[mode]
+        self.seed = seed
+        self.start = start
+        self.size = (width, height)
+
+    def records(self):
+        # (jenis, waktu, isi); isi TRACK_RESULT = (timestamp, seq, HandResult),
+        # isi RESIZE = (lebar, tinggi)
+        data = self.data
+        offset = HEADER.size
+        while offset < len(data):
+            kind, t = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            if kind == FRAME:
+                yield kind, t, None
+            elif kind == TRACK_RESULT:
+                timestamp, seq, n_hands = TRACK.unpack_from(data, offset)
+                offset += TRACK.size
+                points = np.frombuffer(data, "<f4", n_hands * LANDMARKS * 3, offset).reshape(n_hands, LANDMARKS, 3)
+                offset += points.nbytes
+                hands = [HandLandmarks([Landmark(float(x), float(y), float(z)) for x, y, z in hand])
+                         for hand in points]
+                yield kind, t, (timestamp, seq, HandResult(hands))
+            elif kind == SPAWN:
+                (count,) = COUNT.unpack_from(data, offset)
+                offset += COUNT.size
+                items = np.frombuffer(data, SPAWN_DTYPE, count, offset)
+                offset += items.nbytes
+                yield kind, t, items
+            elif kind == RESIZE:
+                yield kind, t, SIZE.unpack_from(data, offset)
+                offset += SIZE.size
+            elif kind == END:
+                (length,) = COUNT.unpack_from(data, offset)
+                offset += COUNT.size
+                yield kind, t, json.loads(data[offset:offset + length].decode("utf-8"))
+                offset += length
+            else:
+                raise ValueError(f"Record replay tidak dikenal: {kind}")
@@ -0,0 +1,160 @@
+import os
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solo (
+    id INTEGER PRIMARY KEY,
+    tanggal TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    missed INTEGER NOT NULL,
+    level INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS solo_score ON solo (score DESC);
+CREATE INDEX IF NOT EXISTS solo_level_score ON solo (level, score DESC);
+CREATE INDEX IF NOT EXISTS solo_tanggal ON solo (tanggal);
+
+CREATE TABLE IF NOT EXISTS multiplayer (
+    id INTEGER PRIMARY KEY,
+    tanggal TEXT NOT NULL,
+    player1 INTEGER NOT NULL,
+    player2 INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    pemenang TEXT NOT NULL,
+    highscore INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS multiplayer_highscore ON multiplayer (highscore DESC);
+CREATE INDEX IF NOT EXISTS multiplayer_level_highscore ON multiplayer (level, highscore DESC);
+CREATE INDEX IF NOT EXISTS multiplayer_tanggal ON multiplayer (tanggal);
+"""
+
+INSERTS = {
+    "solo": "INSERT INTO solo (tanggal, score, missed, level) VALUES (?, ?, ?, ?)",
+    "multiplayer": "INSERT INTO multiplayer (tanggal, player1, player2, level, pemenang, highscore) "
+                   "VALUES (?, ?, ?, ?, ?, ?)",
+}
+
+COLUMNS = {
+    "solo": ("tanggal", "score", "missed", "level"),
+    "multiplayer": ("tanggal", "player1", "player2", "level", "pemenang", "highscore"),
+}
+
+SCORE_COLUMN = {"solo": "score", "multiplayer": "highscore"}
+
+# Nama sheet di game_data.xlsx lama (sebelum pindah ke SQLite)
+LEGACY_SHEETS = {"solo": "Soloplayer", "multiplayer": "Multiplayer"}
+
+class ResultsStore:
+    def __init__(self, filename="game_data.db", legacy_xlsx=None):
+        self.filename = filename
+
+        folder = os.path.dirname(self.filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        conn = self.connect()
+        conn.executescript(SCHEMA)
+        self._import_legacy(conn, legacy_xlsx)
+        conn.close()
+
+        # Semua penulisan lewat antrean ke thread penulis
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def connect(self):
+        conn = sqlite3.connect(self.filename, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _import_legacy(self, conn, path):
+        # Riwayat dari Excel lama diimpor sekali, hanya saat database masih kosong
+        if not path or not os.path.exists(path):
+            return
+        if any(conn.execute(f"SELECT 1 FROM {mode} LIMIT 1").fetchone() for mode in INSERTS):
+            return
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            print(f"openpyxl tidak ada, riwayat {path} tidak diimpor")
+            return
+
+        wb = load_workbook(path, read_only=True)
+        imported = 0
+        with conn:
+            for mode, sheet in LEGACY_SHEETS.items():
+                if sheet not in wb.sheetnames:
+                    continue
+                n = len(COLUMNS[mode])
+                rows = []
+                for row in wb[sheet].iter_rows(min_row=2, values_only=True):
+                    row = tuple(row[:n])
+                    if len(row) < n or any(v is None for v in row):
+                        continue
+                    tanggal = row[0].strftime("%Y-%m-%d %H:%M") if isinstance(row[0], datetime) else str(row[0])
+                    rows.append((tanggal,) + row[1:])
+                conn.executemany(INSERTS[mode], rows)
+                imported += len(rows)
+        wb.close()
+        print(f"{imported} baris riwayat diimpor dari {path}")
+
+    def _now(self):
+        return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    def save_solo(self, score, missed, level):
+        self._queue.put(("solo", (self._now(), score, missed, level)))
+
+    def save_multiplayer(self, player1, player2, level):
+        if player1 > player2:
+            winner = "Player1"
+        elif player2 > player1:
+            winner = "Player2"
+        else:
+            winner = "Draw"
+
+        highscore = max(player1, player2)
+        self._queue.put(("multiplayer", (self._now(), player1, player2, level, winner, highscore)))
+
+    def _write_loop(self):
+        conn = self.connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            jobs = [job for job in batch if job is not None]
+            running = len(jobs) == len(batch)
+            try:
+                with conn:
+                    for mode, row in jobs:
+                        conn.execute(INSERTS[mode], row)
+            except sqlite3.Error as e:
+                print(f"Gagal menyimpan data: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    def flush(self):
+        self._queue.join()
+
+    def rows(self, mode):
+        conn = self.connect()
+        try:
+            cols = ", ".join(COLUMNS[mode])
+            order = SCORE_COLUMN[mode]
+            yield from conn.execute(f"SELECT {cols} FROM {mode} ORDER BY {order} DESC, id")
+        finally:
+            conn.close()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5.0)
@@ -1,8 +1,9 @@
 import os
+import time
 import pygame
 
 class SoundManager:
-    def __init__(self, folder_candidates):
+    def __init__(self, folder_candidates, min_interval=0.04):
         self.folder = ""
         for f in folder_candidates:
             if os.path.exists(f):
@@ -10,21 +11,56 @@ class SoundManager:
                 break
 
         self.sounds = {}
+        # Tiap kategori punya channel sendiri supaya tidak saling merebut
+        self.channels = {}
+        # Waktu mulai tiap channel, sejajar dengan self.channels[key]
+        self.started = {}
+        self.min_interval = {}
+        self.default_interval = min_interval
+        self.last_played = {}
+        self.coalesced = 0
+        self._reserved = 0
 
-    def load(self, key, filename):
+    def load(self, key, filename, channels=1, min_interval=None):
+        self.sounds[key] = None
         if not self.folder:
-            self.sounds[key] = None
             return
         path = os.path.join(self.folder, filename)
-        if os.path.exists(path):
-            self.sounds[key] = pygame.mixer.Sound(path)
-        else:
-            self.sounds[key] = None
-
-    def play(self, key):
-        s = self.sounds.get(key)
-        print(f"Playing: {key}")
-        if s:
-            s.play()
-        else:
-            print(f"Sound {key} not found!")
\ No newline at end of file
+        if not os.path.exists(path):
+            print(f"Sound {key} not found!")
+            return
+
+        # Sound didekode penuh ke memori di sini, bukan saat pertama dimainkan
+        self.sounds[key] = pygame.mixer.Sound(path)
+        self.min_interval[key] = self.default_interval if min_interval is None else min_interval
+
+        first = self._reserved
+        self._reserved += channels
+        if pygame.mixer.get_num_channels() < self._reserved:
+            pygame.mixer.set_num_channels(self._reserved)
+        pygame.mixer.set_reserved(self._reserved)
+        self.channels[key] = [pygame.mixer.Channel(i) for i in range(first, self._reserved)]
+        self.started[key] = [0.0] * channels
+
+    def play(self, key, now=None):
+        sound = self.sounds.get(key)
+        if sound is None:
+            return
+
+        # Pemicu berulang dalam jendela singkat (mis. combo di satu frame) digabung
+        now = time.perf_counter() if now is None else now
+        if now - self.last_played.get(key, -1.0) < self.min_interval[key]:
+            self.coalesced += 1
+            return
+        self.last_played[key] = now
+
+        pool = self.channels[key]
+        started = self.started[key]
+        free = [i for i, channel in enumerate(pool) if not channel.get_busy()]
+        # Semua sibuk: channel yang paling lama berbunyi dalam kategori ini dipakai ulang
+        i = free[0] if free else min(range(len(pool)), key=started.__getitem__)
+        started[i] = now
+        pool[i].play(sound)
+
+    def stats(self):
+        return {"coalesced": self.coalesced}
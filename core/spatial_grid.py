@@ -0,0 +1,111 @@
+import numpy as np
+from core.collision import fruit_circles
+
+# Di bawah jumlah buah ini brute-force NumPy lebih cepat dari indeks grid
+# (lihat benchmarks/bench_slicing.py dan bench_fruits.py); di game normal 5-18 buah
+GRID_MIN_FRUITS = 1000
+
+# Offset 3x3 sel tetangga
+_DR = np.repeat(np.arange(-1, 2), 3)
+_DC = np.tile(np.arange(-1, 2), 3)
+
+class SpatialGrid:
+    def __init__(self, width, height, cell_size=128, top=-900, min_fruits=GRID_MIN_FRUITS):
+        # Buah diindeks dari titik tengahnya; dua radius hitbox dijumlah harus
+        # <= cell_size supaya cek tumpukan cukup memeriksa sel tetangga
+        self.cell_size = cell_size
+        self.top = top
+        self.min_fruits = min_fruits
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        self.cols = max(1, -(-width // self.cell_size))
+        self.rows = max(1, -(-(height - self.top) // self.cell_size)) + 1
+        self.clear()
+
+    def clear(self):
+        # Tanpa indeks: slice_segment dan cek spawn memakai jalur brute-force
+        self.indexed = False
+        self.order = None
+        self.starts = None
+        self.reach = 0.0
+
+    def _rows_cols(self, cx, cy):
+        # Kali + astype jauh lebih cepat dari floor_divide float; nilai negatif
+        # terpotong ke 0 lalu tetap dijepit ke sel pertama. int16 supaya argsort
+        # stabil memakai radix sort
+        inv = 1.0 / self.cell_size
+        col = np.minimum(np.maximum((cx * inv).astype(np.int16), 0), self.cols - 1)
+        row = np.minimum(np.maximum(((cy - self.top) * inv).astype(np.int16), 0), self.rows - 1)
+        return row, col
+
+    def _around(self, row, col):
+        # Sel tetangga (3x3) untuk tiap sel, bentuk (n, 9)
+        r = np.clip(row[:, None] + _DR, 0, self.rows - 1)
+        c = np.clip(col[:, None] + _DC, 0, self.cols - 1)
+        return r * self.cols + c
+
+    def _members(self, cells):
+        # Isi semua sel dalam `cells` sekaligus; juga jumlah isi per sel
+        lo = self.starts[cells]
+        counts = self.starts[cells + 1] - lo
+        ends = np.cumsum(counts)
+        index = np.arange(ends[-1] if len(ends) else 0) + np.repeat(lo - ends + counts, counts)
+        return self.order[index], counts
+
+    def update(self, pool):
+        live = pool.live_slots()
+        if len(live) < self.min_fruits:
+            self.clear()
+            return
+
+        # Slot diurutkan per sel; isi sel c = order[starts[c]:starts[c + 1]]
+        cx, cy, r = fruit_circles(pool, live)
+        self.reach = float(r.max())
+        row, col = self._rows_cols(cx, cy)
+        cells = row * self.cols + col
+        self.order = live[np.argsort(cells, kind="stable")]
+        self.starts = np.zeros(self.rows * self.cols + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cells, minlength=self.rows * self.cols), out=self.starts[1:])
+        self.indexed = True
+
+    def overlapping(self, pool, slots, batch=None):
+        # Mask slot (baru di-spawn) yang hitbox-nya menumpuk buah hidup lain.
+        # batch: semua slot hasil spawn yang sama, belum masuk indeks
+        k = len(slots)
+        if self.indexed:
+            cx, cy, _ = fruit_circles(pool, slots)
+            others, counts = self._members(self._around(*self._rows_cols(cx, cy)).ravel())
+            owner = np.repeat(np.repeat(np.arange(k), 9), counts)
+            if batch is not None and len(batch):
+                owner = np.concatenate((owner, np.repeat(np.arange(k), len(batch))))
+                others = np.concatenate((others, np.tile(batch, k)))
+        else:
+            live = pool.live_slots()
+            owner = np.repeat(np.arange(k), len(live))
+            others = np.tile(live, k)
+
+        mine = slots[owner]
+        ax, ay, ar = fruit_circles(pool, mine)
+        bx, by, br = fruit_circles(pool, others)
+        dx, dy, reach = bx - ax, by - ay, ar + br
+        hit = (others != mine) & (dx * dx + dy * dy < reach * reach)
+        return np.bincount(owner[hit], minlength=k) > 0
+
+    def _span(self, lo, hi, offset, count):
+        # Sel yang memuat titik tengah buah dalam jarak hitbox terbesar dari [lo, hi]
+        first = int((lo - self.reach - offset) // self.cell_size)
+        last = int((hi + self.reach - offset) // self.cell_size)
+        return min(max(first, 0), count - 1), min(max(last, 0), count - 1)
+
+    def query_segment(self, start, end):
+        # Kotak sel di sekitar segmen. Sel satu baris berurutan di self.order,
+        # jadi isinya cukup diambil dengan satu irisan per baris
+        x0, y0 = start
+        x1, y1 = end
+        c0, c1 = self._span(min(x0, x1), max(x0, x1), 0, self.cols)
+        r0, r1 = self._span(min(y0, y1), max(y0, y1), self.top, self.rows)
+        starts = self.starts
+        parts = [self.order[starts[r * self.cols + c0]:starts[r * self.cols + c1 + 1]]
+                 for r in range(r0, r1 + 1)]
+        return np.sort(np.concatenate(parts))
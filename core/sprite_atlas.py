@@ -0,0 +1,87 @@
+import os
+from collections import OrderedDict
+import cv2
+import numpy as np
+from core.compositor import Sprite
+
+class AtlasEntry:
+    def __init__(self, sprite_id, name, size, is_bomb, sprite):
+        self.sprite_id = sprite_id
+        self.name = name
+        self.size = size
+        self.is_bomb = is_bomb
+        self.sprite = sprite
+
+
+class SpriteAtlas:
+    def __init__(self, image_folder="assets/images", min_size=70, max_size=120, step=10, max_scaled=4):
+        self.sizes = list(range(min_size, max_size + 1, step))
+        if self.sizes[-1] != max_size:
+            self.sizes.append(max_size)
+
+        self.names = []
+        self.bombs = []
+        entries = []
+        for f in sorted(os.listdir(image_folder)):
+            if not f.endswith(".png"):
+                continue
+            base = cv2.imread(os.path.join(image_folder, f), cv2.IMREAD_UNCHANGED)
+            if base is None:
+                continue
+
+            name = os.path.splitext(f)[0]
+            is_bomb = "bomb" in f.lower()
+            self.names.append(name)
+            self.bombs.append(is_bomb)
+            for size in self.sizes:
+                img = cv2.resize(base, (size, size), interpolation=cv2.INTER_AREA)
+                entries.append(AtlasEntry(len(entries), name, size, is_bomb, Sprite(img)))
+
+        if not self.names:
+            raise Exception("Tidak ada file PNG di folder 'images'!")
+
+        self.entries = tuple(entries)
+        self.sprites = tuple(e.sprite for e in entries)
+        self.entry_sizes = np.array([e.size for e in entries], dtype=np.int32)
+        self.entry_bombs = np.array([e.is_bomb for e in entries], dtype=bool)
+        self._size_table = np.array(self.sizes, dtype=np.int32)
+        # Skala lain (resize window / F5-F6) disimpan LRU; skala 1.0 selalu self.sprites
+        self._scaled = OrderedDict()
+        self.max_scaled = max_scaled
+
+    def __len__(self):
+        return len(self.entries)
+
+    def size_bucket(self, size):
+        return min(range(len(self.sizes)), key=lambda i: abs(self.sizes[i] - size))
+
+    def entry_id(self, fruit_index, size):
+        return fruit_index * len(self.sizes) + self.size_bucket(size)
+
+    def entry_ids(self, fruit_indices, sizes):
+        sizes = np.asarray(sizes, dtype=np.int32)
+        buckets = np.abs(sizes[:, None] - self._size_table[None, :]).argmin(axis=1)
+        return np.asarray(fruit_indices, dtype=np.int32) * len(self.sizes) + buckets
+
+    def get(self, fruit_index, size):
+        return self.entries[self.entry_id(fruit_index, size)]
+
+    def scaled_sprites(self, scale):
+        # Sprite untuk resolusi render yang lebih kecil, urutan id sama
+        scale = round(scale, 3)
+        if scale == 1.0:
+            return self.sprites
+        sprites = self._scaled.get(scale)
+        if sprites is not None:
+            self._scaled.move_to_end(scale)
+            return sprites
+
+        sprites = []
+        for entry in self.entries:
+            size = max(1, int(round(entry.size * scale)))
+            img = cv2.resize(entry.sprite.image, (size, size), interpolation=cv2.INTER_AREA)
+            sprites.append(Sprite(img))
+        sprites = self._scaled[scale] = tuple(sprites)
+        while len(self._scaled) > self.max_scaled:
+            self._scaled.popitem(last=False)
+        return sprites
@@ -0,0 +1,31 @@
+class FixedTimestep:
+    def __init__(self, step_hz=20, max_steps=8):
+        # Kecepatan buah (vy) didefinisikan per langkah 1/20 detik
+        self.dt = 1.0 / step_hz
+        self.max_steps = max_steps
+        self.reset()
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self, now):
+        if self.last_time is None:
+            self.last_time = now
+            return 0
+
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator // self.dt)
+        if steps > self.max_steps:
+            # Terlalu lama macet: buang sisa waktu daripada mengejar
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.dt, 1.0)
@@ -0,0 +1,249 @@
+import argparse
+import json
+import math
+import os
+import time
+import numpy as np
+import pygame
+from game.runtime import GameRuntime
+
+class NullCamera:
+    def read(self):
+        return False, None, 0.0
+
+    def stats(self):
+        return {}
+
+    def set_resolution(self, width, height):
+        pass
+
+    def pause(self):
+        pass
+
+    def resume(self):
+        pass
+
+    def release(self):
+        pass
+
+
+class NullSounds:
+    def load(self, key, filename, channels=1, min_interval=None):
+        pass
+
+    def play(self, key, now=None):
+        pass
+
+
+class HeadlessRuntime(GameRuntime):
+    def start(self):
+        if self.started:
+            return self
+
+        from core.hand_tracker import ScriptedHandTracker
+        from core.sprite_atlas import SpriteAtlas
+        from core.background import BackgroundCache
+
+        self.camera = NullCamera()
+        self.trackers = {1: ScriptedHandTracker(), 2: ScriptedHandTracker()}
+        self.atlas = SpriteAtlas()
+        self.backgrounds = BackgroundCache()
+        self.sounds = NullSounds()
+        self.data_saver = None
+        self.record_dir = None
+        for key, size in (("card", (350, 350)), ("btn1", (90, 90)), ("btn2", (90, 90)), ("btn3", (90, 90))):
+            self.ui_images[key] = pygame.Surface(size)
+
+        self.started = True
+        return self
+
+    def close(self):
+        self.started = False
+
+
+def sweep_trajectory(mode):
+    # Gerakan jari sintetis (koordinat ternormalisasi 0..1) yang menyapu layar
+    def solo(frame, t):
+        return [(0.5 + 0.4 * math.sin(t * 4.4), 0.55 + 0.3 * math.sin(t * 1.45))]
+
+    def multi(frame, t):
+        return [
+            (0.25 + 0.2 * math.sin(t * 4.4), 0.55 + 0.3 * math.sin(t * 1.45)),
+            (0.75 + 0.2 * math.sin(t * 3.9 + 1.0), 0.55 + 0.3 * math.sin(t * 1.7 + 0.5)),
+        ]
+
+    return solo if mode == "solo" else multi
+
+
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(q / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _game_class(mode):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    if mode == "solo":
+        from game.solo_game import SoloFruitNinjaGame
+        return SoloFruitNinjaGame, 1
+    from game.multi_game import MultiFruitNinjaGame
+    return MultiFruitNinjaGame, 2
+
+
+def _timing(timings):
+    ordered = sorted(timings)
+    return {
+        "mean": sum(timings) / len(timings) if timings else 0.0,
+        "p50": _percentile(ordered, 50),
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+def run_headless(mode="solo", seed=0, frames=3000, fps=60, camera_fps=30, trajectory=None,
+                 background_path="assets/themes/2.png"):
+    GameClass, max_hands = _game_class(mode)
+    runtime = HeadlessRuntime().start()
+    game = GameClass(background_path, fps=fps, runtime=runtime, seed=seed)
+    tracker = runtime.tracker(max_hands)
+    trajectory = trajectory or sweep_trajectory(mode)
+
+    # Waktu simulasi, bukan jam dinding, supaya hasil bisa diulang
+    frame_dt = 1.0 / fps
+    cam_every = max(1, round(fps / camera_fps))
+    timings = []
+    frame = 0
+    for frame in range(frames):
+        now = frame * frame_dt
+        if frame % cam_every == 0:
+            tracker.push(now, trajectory(frame, now))
+
+        start = time.perf_counter()
+        game._simulate(now)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        if game.game_over:
+            break
+
+    scores = game._summary()
+    game._cleanup()
+    return {
+        "mode": mode,
+        "seed": seed,
+        "fps": fps,
+        "frames": frame + 1,
+        "game_over": game.game_over,
+        "scores": scores,
+        "timing_ms": _timing(timings),
+        "frame_ms": timings,
+    }
+
+
+def _same_spawn(recorded, slots, sprite_ids, x, y, vy):
+    return (len(recorded) == len(slots)
+            and np.array_equal(recorded["slot"], slots)
+            and np.array_equal(recorded["sprite_id"], sprite_ids)
+            and np.allclose(recorded["x"], x) and np.allclose(recorded["y"], y)
+            and np.allclose(recorded["vy"], vy))
+
+
+def run_replay(path, background_path="assets/themes/2.png"):
+    from core.replay import ReplayReader, FRAME, TRACK_RESULT, SPAWN, RESIZE, END
+
+    reader = ReplayReader(path)
+    GameClass, max_hands = _game_class(reader.mode)
+    runtime = HeadlessRuntime().start()
+    game = GameClass(background_path, runtime=runtime, seed=reader.seed)
+    tracker = runtime.tracker(max_hands)
+
+    # Mulai ulang dengan ukuran window saat rekaman supaya spawn awal sama
+    game._set_size(*reader.size)
+    game.fruit_manager.reseed(reader.seed)
+    game.reset_game()
+
+    # Spawn awal terjadi di reset_game(); diambil dari isi pool
+    pool = game.fruits
+    slots = np.arange(pool.count)
+    replayed = [(slots, pool.sprite_id[slots].copy(), pool.x[slots].copy(), pool.y[slots].copy(),
+                 pool.vy[slots].copy())]
+    game.fruit_manager.on_spawn = lambda *spawn: replayed.append(tuple(np.array(a) for a in spawn))
+
+    recorded = []
+    recorded_scores = None
+    timings = []
+    pending = None
+
+    def simulate(now):
+        start = time.perf_counter()
+        game._simulate(now)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Hasil tracking direkam di dalam frame yang memakainya, jadi satu frame
+    # baru disimulasikan setelah semua record miliknya terbaca
+    for kind, t, payload in reader.records():
+        if kind == FRAME:
+            if pending is not None:
+                simulate(pending)
+            pending = t
+        elif kind == TRACK_RESULT:
+            timestamp, _, result = payload
+            tracker.push_result(timestamp, result)
+        elif kind == SPAWN:
+            recorded.append(payload)
+        elif kind == RESIZE:
+            game._set_size(*payload)
+        elif kind == END:
+            recorded_scores = payload
+    if pending is not None:
+        simulate(pending)
+
+    mismatches = sum(1 for rec, spawn in zip(recorded, replayed) if not _same_spawn(rec, *spawn))
+    mismatches += abs(len(recorded) - len(replayed))
+
+    scores = game._summary()
+    game._cleanup()
+    return {
+        "replay": path,
+        "mode": reader.mode,
+        "seed": reader.seed,
+        "frames": len(timings),
+        "duration_s": (pending - reader.start) if pending is not None else 0.0,
+        "game_over": game.game_over,
+        "scores": scores,
+        "recorded_scores": recorded_scores,
+        "matches_recording": recorded_scores == scores and mismatches == 0,
+        "spawn_events": len(recorded),
+        "spawn_mismatches": mismatches,
+        "timing_ms": _timing(timings),
+        "frame_ms": timings,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulasi game tanpa kamera dan jendela")
+    parser.add_argument("--mode", choices=("solo", "multi"), default="solo")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--replay", default=None, help="putar ulang file .njr hasil NINJA_RECORD_DIR")
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args()
+
+    if args.replay:
+        report = run_replay(args.replay)
+    else:
+        report = run_headless(args.mode, args.seed, args.frames, args.fps)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f)
+
+    summary = {k: v for k, v in report.items() if k != "frame_ms"}
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
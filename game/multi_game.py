@@ -1,14 +1,20 @@
+import sqlite3
 import cv2
 import pygame
-import numpy as np
 import time
-from core.fruit import FruitManager
-from core.sound_manager import SoundManager
-from core.hand_tracker import HandTracker
-from core.dataexcel import GameDataSaver
+from core.fruit import FruitManager, FruitPool
+from core.compositor import Compositor
+from core.collision import slice_segment
+from core.spatial_grid import SpatialGrid
+from core.timestep import FixedTimestep
+from core.leaderboard import Leaderboard
+from core.profiler import NULL_PROFILER
+from core.replay import SessionRecorder
+from game.runtime import GameRuntime
+from game.presenter import FramePresenter
 
 class MultiFruitNinjaGame:
-    def __init__(self, background_path="assets/themes/2.png"):
+    def __init__(self, background_path="assets/themes/2.png", fps=60, runtime=None, seed=None):
         pygame.init()
         pygame.mixer.init()
         self.WIDTH, self.HEIGHT = 1280, 720  
@@ -16,42 +22,52 @@ class MultiFruitNinjaGame:
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Ninja Fruits - Multiplayer")
         
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(3, self.WIDTH)
-        self.cap.set(4, self.HEIGHT)
+        # Runtime dari menu dipinjam; kalau tidak ada, game membuat sendiri
+        self.owns_runtime = runtime is None
+        self.runtime = runtime if runtime is not None else GameRuntime(self.WIDTH, self.HEIGHT).start()
+        self.runtime.acquire()
+        self.camera = self.runtime.camera
         
-        self.background_path = background_path 
-        bg_img = cv2.imread(background_path)
-        self.background = cv2.resize(bg_img, (self.WIDTH, self.HEIGHT)) if bg_img is not None else \
-            255 * np.ones((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+        self.background_path = background_path
+        self.background = None
+        self.render_size = None
         
-        self.sounds = SoundManager(["assets/sounds", "ninja_fruit_sounds"])
-        self.sounds.load("slash", "slash.mp3")
-        self.sounds.load("boom", "boom.mp3")
-        self.sounds.load("levelup", "levelup.mp3")
+        self.sounds = self.runtime.sounds
+        self.sound_ms = 0.0
         
         self.FONT = "assets/font/Gang_of_Three_Regular.ttf"
+        self.text = self.runtime.text
         
-        self.hand_tracker = HandTracker(max_hands=2)
-        self.fruit_manager = FruitManager(self.WIDTH, self.HEIGHT)
+        self.hand_tracker = self.runtime.tracker(2)
+        self.MAX_POINTER_AGE = 0.25
+        self.fruit_manager = FruitManager(self.WIDTH, self.HEIGHT, atlas=self.runtime.atlas, seed=seed)
+        self.MAX_FRUITS = 18
+        self.compositor = Compositor()
+        self.presenter = FramePresenter(self.WIDTH, self.HEIGHT)
+        self.sprites = self.runtime.atlas.sprites
+        self.grid = SpatialGrid(self.WIDTH, self.HEIGHT)
         self.clock = pygame.time.Clock()
-
-        self.card_img = pygame.image.load("assets/images2/card.png")
-        self.btn1_img = pygame.image.load("assets/images2/1.png")
-        self.btn2_img = pygame.image.load("assets/images2/2.png")
-        self.btn3_img = pygame.image.load("assets/images2/6.png")
-
-        self.card_img = pygame.transform.scale(self.card_img, (350, 350))
-        self.btn1_img = pygame.transform.scale(self.btn1_img, (90, 90))
-        self.btn2_img = pygame.transform.scale(self.btn2_img, (90, 90))
-        self.btn3_img = pygame.transform.scale(self.btn3_img, (90, 90))
-        self.data_saver = GameDataSaver()
+        self.FPS = fps
+        self.timestep = FixedTimestep(step_hz=20)
+        self.profiler = self.runtime.profiler
+        self.profiled_seq = 0
+
+        self.card_img = self.runtime.ui_images["card"]
+        self.btn1_img = self.runtime.ui_images["btn1"]
+        self.btn2_img = self.runtime.ui_images["btn2"]
+        self.btn3_img = self.runtime.ui_images["btn3"]
+        self.data_saver = self.runtime.data_saver
+        self.leaderboard = Leaderboard(self.data_saver)
         self.save_message = None
         self.save_message_time = 0
+        # NINJA_RECORD_DIR aktif: tiap sesi direkam ke file replay sendiri
+        self.recorder = SessionRecorder("multi", self.runtime.record_dir, self._summary)
+        self._update_size()
         self.reset_game()
         self.start_time = time.time()
 
     def reset_game(self):
+        self.recorder.restart(self.fruit_manager, self.WIDTH, self.HEIGHT)
         self.player1 = 0
         self.player2 = 0
         self.p1_alive = True
@@ -60,48 +76,61 @@ class MultiFruitNinjaGame:
         self.p2_prev = None
         self.p1_buf = []
         self.p2_buf = []
+        self.p1_pos = None
+        self.p2_pos = None
+        self.p1_slice = None
+        self.p2_slice = None
+        self.track_seq = 0
+        self.track_time = None
         self.level = 1
-        self.fruits = [self.fruit_manager.spawn_fruit_multi(1, True, True) for _ in range(7)]
+        self.fruits = FruitPool(self.MAX_FRUITS)
+        self.fruits.activate(7)
+        self.grid.clear()
+        self.fruit_manager.fill_multi(self.fruits, self.fruits.free_slots(), 1, True, True, grid=self.grid)
         self.last_death_time = None
         self.game_over = False
         self.show_go_screen = False      
         self.go_start_ticks = 0          
         self.GO_DURATION = 2000
+        self.go_stats = None
+        self.timestep.reset()
+        self.presenter.invalidate()
+
+    def _summary(self):
+        return {"player1": self.player1, "player2": self.player2, "level": self.level,
+                "p1_alive": self.p1_alive, "p2_alive": self.p2_alive}
 
-    def _overlay_image(self, bg, fg, x, y):
-        h, w = fg.shape[:2]
-        if len(fg.shape) == 3 and fg.shape[2] == 3:
-            fg = np.dstack((fg, np.ones((h, w), dtype=np.uint8) * 255))
-        if x < 0 or y < 0 or x + w > self.WIDTH or y + h > self.HEIGHT:
-            return bg
-        alpha = fg[:, :, 3] / 255.0
-        for c in range(3):
-            bg[y:y+h, x:x+w, c] = (alpha * fg[:, :, c] + (1 - alpha) * bg[y:y+h, x:x+w, c]).astype(np.uint8)
-        return bg
+    def _set_size(self, width, height):
+        # Ukuran dunia simulasi; juga dipanggil saat replay
+        self.WIDTH, self.HEIGHT = width, height
+        self.fruit_manager.WIDTH = width
+        self.fruit_manager.HEIGHT = height
+        self.grid.resize(width, height)
 
     def _update_size(self):
         new_w, new_h = self.screen.get_size()
         if new_w != self.WIDTH or new_h != self.HEIGHT:
-            self.WIDTH, self.HEIGHT = new_w, new_h
-            bg_img = cv2.imread(self.background_path)
-            self.background = cv2.resize(bg_img, (self.WIDTH, self.HEIGHT)) if bg_img is not None else \
-                255 * np.ones((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
-            self.fruit_manager.WIDTH = self.WIDTH
-            self.fruit_manager.HEIGHT = self.HEIGHT
-
-    def _assign_hands(self, result, cam_w, cam_h):
+            self._set_size(new_w, new_h)
+            self.recorder.resize(new_w, new_h)
+
+        # Resolusi render = ukuran window x skala render (F5/F6)
+        scale = self.runtime.render_scale
+        render_size = (max(1, int(self.WIDTH * scale)), max(1, int(self.HEIGHT * scale)))
+        if render_size != self.render_size:
+            self.render_size = render_size
+            self.background = self.runtime.backgrounds.get(self.background_path, render_size)
+            render_scale = render_size[0] / self.WIDTH
+            self.presenter.resize(render_size[0], render_size[1], render_scale)
+            self.sprites = self.runtime.atlas.scaled_sprites(render_scale)
+
+    def _assign_hands(self, result):
         p1_hand = None
         p2_hand = None
         
-        scale_x = self.WIDTH / cam_w
-        scale_y = self.HEIGHT / cam_h
-        
         if result.multi_hand_landmarks:
             for hand_landmark in result.multi_hand_landmarks:
-                lx = int(hand_landmark.landmark[8].x * cam_w)
-                ly = int(hand_landmark.landmark[8].y * cam_h)
-                gx = int(lx * scale_x)
-                gy = int(ly * scale_y)
+                gx = int(hand_landmark.landmark[8].x * self.WIDTH)
+                gy = int(hand_landmark.landmark[8].y * self.HEIGHT)
                 
                 if gx < self.WIDTH // 2:
                     if self.p1_alive:
@@ -133,97 +162,140 @@ class MultiFruitNinjaGame:
     def _draw_pointer(self, frame, pos, color_outer, color_inner):
         if pos is None:
             return frame
-        x, y = pos
-        cv2.circle(frame, (x, y), 18, color_outer, -1)
-        cv2.circle(frame, (x, y), 9, color_inner, -1)
+        scale = self.presenter.scale
+        x, y = int(pos[0] * scale), int(pos[1] * scale)
+        r = max(2, int(18 * scale))
+        cv2.circle(frame, (x, y), r, color_outer, -1)
+        cv2.circle(frame, (x, y), max(1, int(9 * scale)), color_inner, -1)
+        self.presenter.add((x - r - 1, y - r - 1, 2 * r + 3, 2 * r + 3))
         return frame
 
-    def _handle_hands_and_slice(self, cam_frame, frame, now):
-        result = self.hand_tracker.process(cam_frame)
-        cam_h, cam_w = cam_frame.shape[:2]
-        
-        p1_hand, p2_hand = self._assign_hands(result, cam_w, cam_h)
-        
-        # Smooth and draw P1 
+    def _process_tracking(self, tracked):
+        p1_hand, p2_hand = self._assign_hands(tracked.result)
+        self.track_time = tracked.timestamp
+        self.p1_pos = None
+        self.p2_pos = None
+
+        # Smooth P1
         if self.p1_alive and p1_hand is not None:
             smooth_p1 = self._smooth_hand(p1_hand, self.p1_buf, self.p1_prev)
             if smooth_p1:
-                frame = self._draw_pointer(frame, smooth_p1, (0, 255, 255), (0, 180, 255))
+                self.p1_pos = smooth_p1
                 self.p1_prev = smooth_p1
-        
-        # Smooth and draw P2   
+
+        # Smooth P2
         if self.p2_alive and p2_hand is not None:
             smooth_p2 = self._smooth_hand(p2_hand, self.p2_buf, self.p2_prev)
             if smooth_p2:
-                frame = self._draw_pointer(frame, smooth_p2, (0, 200, 255), (0, 120, 255))
+                self.p2_pos = smooth_p2
                 self.p2_prev = smooth_p2
-        
-        # Slice detection
-        for fruit in self.fruits:
-            if not fruit.alive or fruit.cut:
-                continue
-            
-            fx, fy = fruit.x, fruit.y
-            fh, fw = fruit.img.shape[:2]
-            
-            if self.p1_alive and self.p1_prev is not None:
-                px, py = self.p1_prev
-                if fx < px < fx + fw and fy < py < fy + fh:
-                    fruit.cut = True
-                    if fruit.is_bomb and not self.game_over:
-                        self.p1_alive = False
-                        self.sounds.play("boom")
-
-                        if not self.p2_alive:
-                            self.game_over = True
-                            self.show_go_screen = True
-                            self.go_start_ticks = pygame.time.get_ticks()
-                            self.last_death_time = now
-                    else:
-                        self.player1 += 1
-                        self.sounds.play("slash")
-                        if (self.player1 + self.player2) % 30 == 0:
-                            self.level += 1
-                            self.sounds.play("levelup")
-            
-            if self.p2_alive and self.p2_prev is not None and not fruit.cut:
-                px, py = self.p2_prev
-                if fx < px < fx + fw and fy < py < fy + fh:
-                    fruit.cut = True
-                    if fruit.is_bomb and not self.game_over:
-                        self.p2_alive = False
-                        self.sounds.play("boom")
-
-                        if not self.p1_alive:
-                            self.game_over = True
-                            self.show_go_screen = True
-                            self.go_start_ticks = pygame.time.get_ticks()
-                            self.last_death_time = now
-                    else:
-                        self.player2 += 1
-                        self.sounds.play("slash")
-                        if (self.player1 + self.player2) % 30 == 0:
-                            self.level += 1
-                            self.sounds.play("levelup")
-        
+
+    def _draw_pointers(self, frame):
+        if self.p1_alive:
+            frame = self._draw_pointer(frame, self.p1_pos, (0, 255, 255), (0, 180, 255))
+        if self.p2_alive:
+            frame = self._draw_pointer(frame, self.p2_pos, (0, 200, 255), (0, 120, 255))
         return frame
 
+    def _poll_hands_and_slice(self, now):
+        tracked = self.hand_tracker.latest()
+        if tracked is not None and tracked.seq != self.track_seq:
+            self.track_seq = tracked.seq
+            self.recorder.track(tracked)
+            self._process_tracking(tracked)
+
+        # Posisi pointer terlalu lama (tracker tertinggal), jangan memotong
+        if self.track_time is None or now - self.track_time > self.MAX_POINTER_AGE:
+            self.p1_slice = None
+            self.p2_slice = None
+            return
+
+        # Slice detection: segmen dari posisi potong terakhir ke posisi sekarang
+        if self.p1_alive and self.p1_prev is not None:
+            start = self.p1_slice if self.p1_slice is not None else self.p1_prev
+            slots, _ = slice_segment(self.fruits, start, self.p1_prev, self.grid)
+            self.p1_slice = self.p1_prev
+            self._cut_fruits(1, slots, now)
+
+        if self.p2_alive and self.p2_prev is not None:
+            start = self.p2_slice if self.p2_slice is not None else self.p2_prev
+            slots, _ = slice_segment(self.fruits, start, self.p2_prev, self.grid)
+            self.p2_slice = self.p2_prev
+            self._cut_fruits(2, slots, now)
+
+    def _cut_fruits(self, player, slots, now):
+        pool = self.fruits
+        for i in slots:
+            if pool.cut[i]:
+                continue
+            pool.cut[i] = True
+            if pool.is_bomb[i] and not self.game_over:
+                if player == 1:
+                    self.p1_alive = False
+                    other_alive = self.p2_alive
+                else:
+                    self.p2_alive = False
+                    other_alive = self.p1_alive
+                self._play("boom")
+
+                if not other_alive:
+                    self.game_over = True
+                    self.show_go_screen = True
+                    self.go_start_ticks = pygame.time.get_ticks()
+                    self.last_death_time = now
+                return
+            else:
+                if player == 1:
+                    self.player1 += 1
+                else:
+                    self.player2 += 1
+                self._play("slash")
+                if (self.player1 + self.player2) % 30 == 0:
+                    self.level += 1
+                    self._play("levelup")
+
     def _update_fruits(self):
-        for fruit in self.fruits:
-            if fruit.alive:
-                fruit.y += fruit.vy
-                if fruit.y > self.HEIGHT + 50:
-                    fruit.alive = False
-        
-        # Respawn fruits 
-        target_count = min(7 + self.level // 1, 18)
-        while len(self.fruits) < target_count:
-            self.fruits.append(self.fruit_manager.spawn_fruit_multi(self.level, self.p1_alive, self.p2_alive))
-        
-        # Replace dead/cut fruits
-        for i, fruit in enumerate(self.fruits):
-            if not fruit.alive or fruit.cut:
-                self.fruits[i] = self.fruit_manager.spawn_fruit_multi(self.level, self.p1_alive, self.p2_alive)
+        pool = self.fruits
+        pool.step(self.HEIGHT + 50)
+        self.grid.update(pool)
+
+        # Respawn fruits: slot baru + slot yang mati/terpotong
+        pool.activate(min(7 + self.level // 1, self.MAX_FRUITS))
+        self.fruit_manager.fill_multi(pool, pool.free_slots(), self.level, self.p1_alive, self.p2_alive,
+                                       grid=self.grid)
+
+    def _play(self, key):
+        # Waktu play() dipisah dari "simulate" di profiler
+        start = time.perf_counter()
+        self.sounds.play(key)
+        self.sound_ms += (time.perf_counter() - start) * 1000
+
+    def _simulate(self, now):
+        # Logika game tanpa render; dipakai run() dan mode headless
+        self.recorder.frame(now)
+        self._poll_hands_and_slice(now)
+        for _ in range(self.timestep.advance(now)):
+            self._update_fruits()
+
+    def _draw_hud(self, dirty):
+        hud = (
+            (f"Player1: {self.player1}", 42, (255, 255, 0)),
+            (f"Player2: {self.player2}", 42, (255, 200, 0)),
+            (f"Level: {self.level}", 32, (255, 255, 255)),
+        )
+        for i, (text, size, color) in enumerate(hud):
+            rect = self.screen.blit(self.text.render(text, size, color, self.FONT), (30, 25 + i * 60))
+            dirty.append(self.presenter.add_overlay(rect))
+
+    def _leaderboard_stats(self):
+        highscore = max(self.player1, self.player2)
+        try:
+            rank = self.leaderboard.rank("multiplayer", highscore)
+            best = max(self.leaderboard.best("multiplayer"), highscore)
+        except sqlite3.Error as e:
+            print(f"Leaderboard tidak bisa dibaca: {e}")
+            return 1, highscore
+        return rank, best
 
     def _setup_gameover_ui(self):
         cx = self.WIDTH // 2
@@ -239,36 +311,42 @@ class MultiFruitNinjaGame:
     def run(self):
         running = True
         while running:
-            success, cam = self.cap.read()
-            if not success:
-                time.sleep(0.05)
-                continue
-            cam = cv2.flip(cam, 1)
+            # Profiler nyata hanya dipakai saat HUD (F3) atau log aktif
+            prof = self.profiler if self.profiler.active else NULL_PROFILER
+            prof.begin_frame()
+
+            success, cam, cam_time = self.camera.read()
+            if success:
+                self.hand_tracker.submit(cv2.flip(cam, 1), cam_time)
+            prof.mark("capture")
 
             self._update_size()
-            frame = self.background.copy()
+            frame = self.presenter.begin(self.background)
             now = time.time()
 
-            frame = self._handle_hands_and_slice(cam, frame, now)
-            self._update_fruits()
+            self.sound_ms = 0.0
+            self._simulate(now)
+            prof.mark("simulate")
+            prof.record("sound", self.sound_ms, within="simulate")
+            frame = self._draw_pointers(frame)
             
-            for fruit in self.fruits:
-                if fruit.alive:
-                    frame = self._overlay_image(frame, fruit.img, int(fruit.x), int(fruit.y))
+            sprites = self.sprites
+            for sprite_id, x, y in self.fruits.draw_list(self.timestep.alpha, self.presenter.scale):
+                self.presenter.add(self.compositor.blit(frame, sprites[sprite_id], x, y))
             
             if not self.game_over:
-                cv2.putText(frame, f"Player1: {self.player1}", (30, 60),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.3, (0,255,255), 3)
-                cv2.putText(frame, f"Player2: {self.player2}", (30, 120),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.3, (0,200,255), 3)
-                cv2.putText(frame, f"Level: {self.level}", (30, 180),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255,255,255), 2)
-                
-                cv2.line(frame, (self.WIDTH//2, 0), (self.WIDTH//2, self.HEIGHT), (30,30,30), 2)
+                mid_x = self.presenter.width // 2
+                cv2.line(frame, (mid_x, 0), (mid_x, self.presenter.height), (30,30,30), 2)
+                self.presenter.add((mid_x - 2, 0, 4, self.presenter.height))
             
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-            self.screen.blit(surface, (0, 0))
+            prof.mark("composite")
+
+            if self.game_over:
+                # Overlay game over menutupi seluruh layar
+                self.presenter.invalidate()
+            dirty = self.presenter.present(self.screen)
+            if not self.game_over:
+                self._draw_hud(dirty)
 
             # Game Over
             if self.game_over:
@@ -280,8 +358,7 @@ class MultiFruitNinjaGame:
                 elapsed = pygame.time.get_ticks() - self.go_start_ticks
 
                 if self.show_go_screen and elapsed < self.GO_DURATION:
-                    font_go = pygame.font.Font(self.FONT, 96)
-                    go_text = font_go.render("GAME OVER", True, (255, 60, 60))
+                    go_text = self.text.render("GAME OVER", 96, (255, 60, 60), self.FONT)
                     go_rect = go_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
                     self.screen.blit(go_text, go_rect)
                 else:
@@ -291,21 +368,27 @@ class MultiFruitNinjaGame:
 
                     self.screen.blit(self.card_img, self.card_rect)
 
-                    font_score = pygame.font.Font(self.FONT, 36)
+                    if self.go_stats is None:
+                        self.go_stats = self._leaderboard_stats()
+                    rank, best = self.go_stats
+
 
-                    p1_text = font_score.render(f"P1 : {self.player1}", True, (0, 0, 0))
-                    p2_text = font_score.render(f"P2 : {self.player2}", True, (0, 0, 0))
-                    level_text = font_score.render(f"LEVEL : {self.level}", True, (0, 0, 0))
+                    p1_text = self.text.render(f"P1 : {self.player1}", 36, (0, 0, 0), self.FONT)
+                    p2_text = self.text.render(f"P2 : {self.player2}", 36, (0, 0, 0), self.FONT)
+                    level_text = self.text.render(f"LEVEL : {self.level}", 36, (0, 0, 0), self.FONT)
+                    rank_text = self.text.render(f"RANK : {rank}   BEST : {best}", 28, (0, 0, 0), self.FONT)
 
                     gap = 35
 
                     p1_rect = p1_text.get_rect(center=(self.card_rect.centerx, self.card_rect.centery - gap))
                     p2_rect = p2_text.get_rect(center=(self.card_rect.centerx, self.card_rect.centery))
                     level_rect = level_text.get_rect(center=(self.card_rect.centerx, self.card_rect.centery + gap))
+                    rank_rect = rank_text.get_rect(center=(self.card_rect.centerx, self.card_rect.centery + 2 * gap))
 
                     self.screen.blit(p1_text, p1_rect)
                     self.screen.blit(p2_text, p2_rect)
                     self.screen.blit(level_text, level_rect)
+                    self.screen.blit(rank_text, rank_rect)
 
                     self.screen.blit(self.btn1_img, self.btn1_rect)
                     self.screen.blit(self.btn2_img, self.btn2_rect)
@@ -313,17 +396,33 @@ class MultiFruitNinjaGame:
 
             if self.save_message:
                 if time.time() - self.save_message_time < 2.5:
-                    font = pygame.font.Font(self.FONT, 28)
-                    text = font.render(self.save_message, True, (0, 255, 0))
+                    text = self.text.render(self.save_message, 28, (0, 255, 0), self.FONT)
                     text_rect = text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 + 265))
                     self.screen.blit(text, text_rect)
+                    dirty.append(self.presenter.add_overlay(text_rect))
                 else:
                     self.save_message = None
 
-            pygame.display.flip()
-            self.clock.tick(20)
+            if self.profiler.show_hud:
+                hud_rect = self.profiler.draw(self.screen, (10, self.HEIGHT - 200))
+                dirty.append(self.presenter.add_overlay(hud_rect))
+            prof.mark("present")
+
+            pygame.display.update([rect for rect in dirty if rect is not None])
+            prof.mark("flip")
+            self.clock.tick(self.FPS)
+            prof.mark("wait")
+
+            if prof.active:
+                tracked = self.hand_tracker.latest()
+                if tracked is not None and tracked.seq != self.profiled_seq:
+                    self.profiled_seq = tracked.seq
+                    prof.record("mediapipe", tracked.process_ms)
+            prof.end_frame()
 
             for event in pygame.event.get():
+                if event.type == pygame.VIDEOEXPOSE:
+                    self.presenter.invalidate()
                 if event.type == pygame.QUIT:
                     self._cleanup()
                     return "exit"
@@ -332,6 +431,15 @@ class MultiFruitNinjaGame:
                     if event.key == pygame.K_ESCAPE:
                         self._cleanup()
                         return "menu"
+                    if event.key == pygame.K_F3:
+                        self.profiler.toggle_hud()
+                        self.presenter.invalidate()
+                    if event.key == pygame.K_F5:
+                        self.runtime.step_render_scale(-1)
+                    if event.key == pygame.K_F6:
+                        self.runtime.step_render_scale(1)
+                    if event.key == pygame.K_F7:
+                        self.runtime.cycle_tracking_size()
                     if self.game_over and event.key == pygame.K_r:
                         self.reset_game()
 
@@ -355,6 +463,10 @@ class MultiFruitNinjaGame:
         return "menu"
 
     def _cleanup(self):
-        self.cap.release()
-        self.hand_tracker.close()
+        self.recorder.stop()
+        self.leaderboard.close()
+        if self.owns_runtime:
+            self.runtime.close()
+        else:
+            self.runtime.release()
         print("Multiplayer game closed safely.")
\ No newline at end of file
@@ -0,0 +1,100 @@
+import numpy as np
+import pygame
+
+class FramePresenter:
+    def __init__(self, width, height, scale=1.0):
+        self.resize(width, height, scale)
+
+    def resize(self, width, height, scale=1.0):
+        # scale: ukuran render dibanding koordinat game (ukuran window)
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self._scaled = None
+        # Frame BGR (urutan cv2) yang memorinya dipakai bersama oleh Surface
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        try:
+            self.surface = pygame.image.frombuffer(self.frame, (width, height), "BGR")
+            self.shared = True
+        except ValueError:
+            # pygame lama belum mengenal format "BGR": satu salinan per frame
+            self.surface = pygame.Surface((width, height), 0, 24)
+            self.shared = False
+
+        self.rects = []
+        self.prev_rects = []
+        self.full = True
+
+    def invalidate(self):
+        # Frame berikutnya disalin dan dikirim ke layar secara utuh
+        self.full = True
+
+    def begin(self, background):
+        if self.full:
+            np.copyto(self.frame, background)
+        else:
+            # Hanya area yang digambar frame lalu dikembalikan ke background
+            for x, y, w, h in self.prev_rects:
+                self.frame[y:y + h, x:x + w] = background[y:y + h, x:x + w]
+        self.rects = []
+        return self.frame
+
+    def _clip(self, rect):
+        x, y, w, h = rect
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + w), self.width), min(int(y + h), self.height)
+        if x0 < x1 and y0 < y1:
+            return (x0, y0, x1 - x0, y1 - y0)
+        return None
+
+    def add(self, rect):
+        # Area frame yang digambar frame ini (sprite, pointer, HUD)
+        if rect is not None:
+            rect = self._clip(rect)
+            if rect is not None:
+                self.rects.append(rect)
+
+    def add_overlay(self, rect):
+        # Untuk yang digambar langsung ke layar setelah present()
+        rect = self._clip(rect)
+        if rect is None:
+            return None
+        self.prev_rects.append(rect)
+        return pygame.Rect(rect)
+
+    def present(self, screen, pos=(0, 0)):
+        size = screen.get_size()
+        if size != (self.width, self.height):
+            return self._present_scaled(screen, size)
+
+        if self.full:
+            dirty = [pygame.Rect(pos, (self.width, self.height))]
+        else:
+            # Area lama (sudah dipulihkan) + area baru
+            dirty = [pygame.Rect(r).move(pos) for r in self.prev_rects + self.rects]
+
+        if not self.shared:
+            pygame.surfarray.blit_array(self.surface, self.frame[:, :, ::-1].swapaxes(0, 1))
+        if self.full:
+            screen.blit(self.surface, pos)
+        else:
+            for rect in dirty:
+                screen.blit(self.surface, rect, rect.move(-pos[0], -pos[1]))
+
+        self.prev_rects = self.rects
+        self.full = False
+        # Daftar ini yang diberikan ke pygame.display.update
+        return dirty
+
+    def _present_scaled(self, screen, size):
+        # Resolusi render lebih kecil dari window: diperbesar lalu dikirim utuh
+        if not self.shared:
+            pygame.surfarray.blit_array(self.surface, self.frame[:, :, ::-1].swapaxes(0, 1))
+        if self._scaled is None or self._scaled.get_size() != size:
+            self._scaled = pygame.Surface(size, 0, self.surface)
+        pygame.transform.scale(self.surface, size, self._scaled)
+        screen.blit(self._scaled, (0, 0))
+
+        self.prev_rects = self.rects
+        self.full = False
+        return [screen.get_rect()]
@@ -0,0 +1,156 @@
+import os
+import threading
+import pygame
+from core.profiler import FrameProfiler
+from ui.text import TextRenderer
+
+# Pilihan yang bisa diganti saat bermain (F5/F6 dan F7)
+RENDER_SCALES = (0.5, 0.67, 0.75, 1.0)
+TRACKING_SIZES = ((480, 270), (640, 360), (960, 540), (1280, 720))
+
+class GameRuntime:
+    def __init__(self, width=1280, height=720, tracking_size=(640, 360), camera_source=None, realtime=True,
+                 db_path=None):
+        self.width = width
+        self.height = height
+        # NINJA_CAMERA: index webcam, file video, folder gambar atau "synthetic"
+        self.camera_source = camera_source if camera_source is not None else os.environ.get("NINJA_CAMERA", 0)
+        self.realtime = realtime
+        # NINJA_DB: lokasi database skor (default game_data.db di folder kerja)
+        self.db_path = db_path if db_path is not None else os.environ.get("NINJA_DB", "game_data.db")
+        self.render_scale = 1.0
+        self.tracking_size = tracking_size
+        self.backgrounds = None
+        self.camera = None
+        self.trackers = {}
+        self.atlas = None
+        self.sounds = None
+        self.data_saver = None
+        self.ui_images = {}
+        self.text = TextRenderer()
+        self.started = False
+
+        # NINJA_PROFILE_LOG=frames.jsonl merekam timing tiap frame ke file
+        self.profiler = FrameProfiler(log_path=os.environ.get("NINJA_PROFILE_LOG"))
+        # NINJA_RECORD_DIR=replays merekam tiap sesi untuk diputar ulang
+        self.record_dir = os.environ.get("NINJA_RECORD_DIR")
+
+        self._thread = None
+        self._error = None
+
+    def start(self):
+        if self.started:
+            return self
+
+        # Modul berat (cv2, mediapipe, numpy) baru diimpor di sini
+        from core.camera import CameraStream
+        from core.hand_tracker import AsyncHandTracker
+        from core.sprite_atlas import SpriteAtlas
+        from core.sound_manager import SoundManager
+        from core.results_store import ResultsStore
+        from core.background import BackgroundCache
+
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+        # Kamera cukup di resolusi tracking; layar dirender terpisah
+        self.camera = CameraStream(self.camera_source, *self.tracking_size, realtime=self.realtime,
+                                   loop=self.realtime).start()
+        self.camera.pause()
+
+        for max_hands in (1, 2):
+            tracker = AsyncHandTracker(max_hands=max_hands, process_size=self.tracking_size)
+            tracker.warm_up()
+            self.trackers[max_hands] = tracker
+
+        self.atlas = SpriteAtlas()
+        self.backgrounds = BackgroundCache()
+
+        self.sounds = SoundManager(["assets/sounds", "ninja_fruit_sounds"])
+        self.sounds.load("slash", "slash.mp3", channels=4)
+        self.sounds.load("boom", "boom.mp3", channels=2)
+        self.sounds.load("levelup", "levelup.mp3", channels=1, min_interval=0.5)
+
+        # Riwayat Excel lama dicari di sebelah database
+        legacy_xlsx = os.path.join(os.path.dirname(self.db_path), "game_data.xlsx")
+        self.data_saver = ResultsStore(self.db_path, legacy_xlsx=legacy_xlsx)
+
+        for key, path, size in (
+            ("card", "assets/images2/card.png", (350, 350)),
+            ("btn1", "assets/images2/1.png", (90, 90)),
+            ("btn2", "assets/images2/2.png", (90, 90)),
+            ("btn3", "assets/images2/6.png", (90, 90)),
+        ):
+            self.ui_images[key] = pygame.transform.scale(pygame.image.load(path), size)
+
+        self.started = True
+        return self
+
+    def start_async(self):
+        # Dipanaskan di background selagi menu sudah tampil
+        if self.started or self._thread is not None:
+            return self
+        self._thread = threading.Thread(target=self._start_background, daemon=True)
+        self._thread.start()
+        return self
+
+    def _start_background(self):
+        try:
+            self.start()
+        except Exception as e:
+            self._error = e
+
+    def wait_ready(self):
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        return self.start()
+
+    def step_render_scale(self, step):
+        scales = RENDER_SCALES
+        index = scales.index(self.render_scale) if self.render_scale in scales else len(scales) - 1
+        self.render_scale = scales[min(max(index + step, 0), len(scales) - 1)]
+        print(f"Skala render: {self.render_scale}")
+        return self.render_scale
+
+    def cycle_tracking_size(self):
+        sizes = TRACKING_SIZES
+        index = sizes.index(self.tracking_size) if self.tracking_size in sizes else 0
+        self.set_tracking_size(sizes[(index + 1) % len(sizes)])
+        return self.tracking_size
+
+    def set_tracking_size(self, size):
+        self.tracking_size = size
+        self.camera.set_resolution(*size)
+        for tracker in self.trackers.values():
+            tracker.process_size = size
+        print(f"Resolusi tracking: {size[0]}x{size[1]}")
+
+    def tracker(self, max_hands):
+        return self.trackers[max_hands]
+
+    def acquire(self):
+        # Hasil tracking dari match sebelumnya tidak boleh terbawa
+        for tracker in self.trackers.values():
+            tracker.reset()
+        self.camera.resume()
+
+    def release(self):
+        self.camera.pause()
+
+    def close(self):
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if not self.started:
+            return
+        self.camera.release()
+        for tracker in self.trackers.values():
+            tracker.close()
+        self.data_saver.close()
+        self.profiler.close()
+        print(f"Camera stats: {self.camera.stats()}")
+        self.started = False
@@ -1,109 +1,155 @@
+import sqlite3
 import cv2
 import pygame
 import numpy as np
 import time
-from core.fruit import FruitManager
-from core.sound_manager import SoundManager
-from core.hand_tracker import HandTracker
-from core.dataexcel import GameDataSaver
+from core.fruit import FruitManager, FruitPool
+from core.compositor import Compositor
+from core.collision import slice_segment
+from core.spatial_grid import SpatialGrid
+from core.timestep import FixedTimestep
+from core.leaderboard import Leaderboard
+from core.profiler import NULL_PROFILER
+from core.replay import SessionRecorder
+from game.runtime import GameRuntime
+from game.presenter import FramePresenter
 
 class SoloFruitNinjaGame:
-    def __init__(self, background_path="assets/themes/2.png"):
+    def __init__(self, background_path="assets/themes/2.png", fps=60, runtime=None, seed=None):
         pygame.init()
         pygame.mixer.init()
         self.WIDTH, self.HEIGHT = 1280, 720   
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Ninja Fruits - Solo")
         
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(3, self.WIDTH)
-        self.cap.set(4, self.HEIGHT)
+        # Runtime dari menu dipinjam; kalau tidak ada, game membuat sendiri
+        self.owns_runtime = runtime is None
+        self.runtime = runtime if runtime is not None else GameRuntime(self.WIDTH, self.HEIGHT).start()
+        self.runtime.acquire()
+        self.camera = self.runtime.camera
         
-        bg_img = cv2.imread(background_path)
         self.background_path = background_path
-        self.background = cv2.resize(bg_img, (self.WIDTH, self.HEIGHT)) if bg_img is not None else \
-            255 * np.ones((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
+        self.background = None
+        self.render_size = None
         
-        self.sounds = SoundManager(["assets/sounds", "ninja_fruit_sounds"])
-        self.sounds.load("slash", "slash.mp3")
-        self.sounds.load("boom", "boom.mp3")
-        self.sounds.load("levelup", "levelup.mp3")
+        self.sounds = self.runtime.sounds
+        self.sound_ms = 0.0
 
         self.FONT = "assets/font/Gang_of_Three_Regular.ttf"
+        self.text = self.runtime.text
         
-        self.hand_tracker = HandTracker(max_hands=1)
-        self.fruit_manager = FruitManager(self.WIDTH, self.HEIGHT)
+        self.hand_tracker = self.runtime.tracker(1)
+        self.MAX_POINTER_AGE = 0.25
+        self.fruit_manager = FruitManager(self.WIDTH, self.HEIGHT, atlas=self.runtime.atlas, seed=seed)
+        self.compositor = Compositor()
+        self.presenter = FramePresenter(self.WIDTH, self.HEIGHT)
+        self.sprites = self.runtime.atlas.sprites
+        self.grid = SpatialGrid(self.WIDTH, self.HEIGHT)
         self.clock = pygame.time.Clock()
+        self.FPS = fps
+        self.timestep = FixedTimestep(step_hz=20)
+        self.profiler = self.runtime.profiler
+        self.profiled_seq = 0
         
         self.start_time = time.time()
         self.sliced_fruits = 0
         self.touched_bombs = 0
 
-        self.card_img = pygame.image.load("assets/images2/card.png")
-        self.btn1_img = pygame.image.load("assets/images2/1.png")
-        self.btn2_img = pygame.image.load("assets/images2/2.png")
-        self.btn3_img = pygame.image.load("assets/images2/6.png")
-
-        self.card_img = pygame.transform.scale(self.card_img, (350, 350))
-        self.btn1_img = pygame.transform.scale(self.btn1_img, (90, 90))
-        self.btn2_img = pygame.transform.scale(self.btn2_img, (90, 90))
-        self.btn3_img = pygame.transform.scale(self.btn3_img, (90, 90))
-        self.data_saver = GameDataSaver()
+        self.card_img = self.runtime.ui_images["card"]
+        self.btn1_img = self.runtime.ui_images["btn1"]
+        self.btn2_img = self.runtime.ui_images["btn2"]
+        self.btn3_img = self.runtime.ui_images["btn3"]
+        self.data_saver = self.runtime.data_saver
+        self.leaderboard = Leaderboard(self.data_saver)
         self.save_message = None
         self.save_message_time = 0
 
+        # NINJA_RECORD_DIR aktif: tiap sesi direkam ke file replay sendiri
+        self.recorder = SessionRecorder("solo", self.runtime.record_dir, self._summary)
+        self._update_size()
         self.reset_game()
 
     def reset_game(self):
+        self.recorder.restart(self.fruit_manager, self.WIDTH, self.HEIGHT)
         self.score = 0
         self.missed = 0
         self.level = 1
-        self.fruits = [self.fruit_manager.spawn_fruit_solo(1) for _ in range(5)]
+        self.fruits = FruitPool(5)
+        self.fruits.activate(5)
+        self.grid.clear()
+        self.fruit_manager.fill_solo(self.fruits, self.fruits.free_slots(), 1, grid=self.grid)
         self.x_buffer = []
         self.y_buffer = []
         self.prev_x = None
         self.prev_y = None
+        self.pointer_pos = None
+        self.track_seq = 0
         self.pointer_history = []
         self.game_over = False
         self.show_go_screen = False      
         self.go_start_ticks = 0          
         self.GO_DURATION = 2000
+        self.timestep.reset()
+        self.presenter.invalidate()
         self.game_over_time = None
+        self.go_stats = None
         self._setup_gameover_ui()
 
-    def _overlay_image(self, bg, fg, x, y):
-        h, w = fg.shape[:2]
-        if len(fg.shape) == 3 and fg.shape[2] == 3:
-            fg = np.dstack((fg, np.ones((h, w), dtype=np.uint8) * 255))
-        if x < 0 or y < 0 or x + w > self.WIDTH or y + h > self.HEIGHT:
-            return bg
-        alpha = fg[:, :, 3] / 255.0
-        for c in range(3):
-            bg[y:y+h, x:x+w, c] = (alpha * fg[:, :, c] + (1 - alpha) * bg[y:y+h, x:x+w, c]).astype(np.uint8)
-        return bg
+    def _summary(self):
+        return {"score": self.score, "missed": self.missed, "level": self.level}
+
+    def _set_size(self, width, height):
+        # Ukuran dunia simulasi; juga dipanggil saat replay
+        self.WIDTH, self.HEIGHT = width, height
+        self.fruit_manager.WIDTH = width
+        self.fruit_manager.HEIGHT = height
+        self.grid.resize(width, height)
 
     def _update_size(self):
         new_w, new_h = self.screen.get_size()
         if new_w != self.WIDTH or new_h != self.HEIGHT:
-            self.WIDTH, self.HEIGHT = new_w, new_h
-            bg_img = cv2.imread(self.background_path)
-            self.background = cv2.resize(bg_img, (self.WIDTH, self.HEIGHT)) if bg_img is not None else \
-                255 * np.ones((self.HEIGHT, self.WIDTH, 3), dtype=np.uint8)
-            self.fruit_manager.WIDTH = self.WIDTH
-            self.fruit_manager.HEIGHT = self.HEIGHT
-
-    def _handle_hand(self, cam_frame, frame, now):
-        result = self.hand_tracker.process(cam_frame)
+            self._set_size(new_w, new_h)
+            self.recorder.resize(new_w, new_h)
+
+        # Resolusi render = ukuran window x skala render (F5/F6)
+        scale = self.runtime.render_scale
+        render_size = (max(1, int(self.WIDTH * scale)), max(1, int(self.HEIGHT * scale)))
+        if render_size != self.render_size:
+            self.render_size = render_size
+            self.background = self.runtime.backgrounds.get(self.background_path, render_size)
+            render_scale = render_size[0] / self.WIDTH
+            self.presenter.resize(render_size[0], render_size[1], render_scale)
+            self.sprites = self.runtime.atlas.scaled_sprites(render_scale)
+
+    def _poll_hand(self, now):
+        tracked = self.hand_tracker.latest()
+        if tracked is not None and tracked.seq != self.track_seq:
+            self.track_seq = tracked.seq
+            self.recorder.track(tracked)
+            self._process_tracking(tracked, now)
+
+    def _draw_pointer(self, frame):
+        if self.pointer_pos is not None:
+            scale = self.presenter.scale
+            x, y = int(self.pointer_pos[0] * scale), int(self.pointer_pos[1] * scale)
+            r = max(2, int(20 * scale))
+            cv2.circle(frame, (x, y), r, (0, 140, 255), -1)
+            cv2.circle(frame, (x, y), max(1, int(10 * scale)), (0, 255, 255), -1)
+            self.presenter.add((x - r - 1, y - r - 1, 2 * r + 3, 2 * r + 3))
+        return frame
+
+    def _process_tracking(self, tracked, now):
+        result = tracked.result
         if not result.multi_hand_landmarks:
-            return frame
+            self.pointer_pos = None
+            return
 
-        cam_h, cam_w = cam_frame.shape[:2]
-        scale_x = self.WIDTH / cam_w
-        scale_y = self.HEIGHT / cam_h
+        # Hasil yang terlalu lama tidak dipakai untuk memotong
+        stale = tracked.age(now) > self.MAX_POINTER_AGE
 
         for hand_lms in result.multi_hand_landmarks:
-            x = int(hand_lms.landmark[8].x * cam_w * scale_x)
-            y = int(hand_lms.landmark[8].y * cam_h * scale_y)
+            x = int(hand_lms.landmark[8].x * self.WIDTH)
+            y = int(hand_lms.landmark[8].y * self.HEIGHT)
 
             # Smoothing buffer
             self.x_buffer.append(x)
@@ -114,60 +160,86 @@ class SoloFruitNinjaGame:
             x = int(sum(self.x_buffer) / len(self.x_buffer))
             y = int(sum(self.y_buffer) / len(self.y_buffer))
 
-            cv2.circle(frame, (x, y), 20, (0, 140, 255), -1)
-            cv2.circle(frame, (x, y), 10, (0, 255, 255), -1)
+            self.pointer_pos = (x, y)
 
             # Anti-jitter
             if self.prev_x is not None:
                 x = int(self.prev_x * 0.5 + x * 0.5)
                 y = int(self.prev_y * 0.5 + y * 0.5)
 
-            self.pointer_history.append((x, y, now))
+            self.pointer_history.append((x, y, tracked.timestamp))
             self.pointer_history = [p for p in self.pointer_history if now - p[2] < 0.25]
 
-            if self.prev_x is not None and self.prev_y is not None:
-                for fruit in self.fruits:
-                    if fruit.alive and not fruit.cut:
-                        fh, fw = fruit.img.shape[:2]
-                        if fruit.x < x < fruit.x + fw and fruit.y < y < fruit.y + fh:
-                            fruit.cut = True
-                            if fruit.is_bomb and not self.game_over:
-                                self.game_over = True
-                                self.show_go_screen = True
-                                self.go_start_ticks = pygame.time.get_ticks()
-                                self.game_over_time = now
-                                self.touched_bombs += 1
-                                self.sounds.play("boom")
-                            else:
-                                self.score += 1
-                                self.sliced_fruits += 1
-                                self.sounds.play("slash")
-                                if self.score % 30 == 0:
-                                    self.level += 1
-                                    self.sounds.play("levelup")
+            if self.prev_x is not None and self.prev_y is not None and not stale:
+                pool = self.fruits
+                slots, _ = slice_segment(pool, (self.prev_x, self.prev_y), (x, y), self.grid)
+                for i in slots:
+                    pool.cut[i] = True
+                    if pool.is_bomb[i] and not self.game_over:
+                        self.game_over = True
+                        self.show_go_screen = True
+                        self.go_start_ticks = pygame.time.get_ticks()
+                        self.game_over_time = now
+                        self.touched_bombs += 1
+                        self._play("boom")
+                    else:
+                        self.score += 1
+                        self.sliced_fruits += 1
+                        self._play("slash")
+                        if self.score % 30 == 0:
+                            self.level += 1
+                            self._play("levelup")
 
             self.prev_x, self.prev_y = x, y
-        return frame
 
     def _update_fruits(self):
-        for fruit in self.fruits:
-            if fruit.alive:
-                fruit.y += fruit.vy
-                if fruit.y > self.HEIGHT and not fruit.counted:
-                    fruit.alive = False
-                    fruit.counted = True
-                    if not fruit.is_bomb:
-                        self.missed += 1
-                        if self.missed >= 10 and not self.game_over:
-                            self.game_over = True
-                            self.show_go_screen = True
-                            self.go_start_ticks = pygame.time.get_ticks()
-                            self.game_over_time = time.time()
-
-        for i in range(len(self.fruits)):
-            if not self.fruits[i].alive or self.fruits[i].cut:
-                self.fruits[i] = self.fruit_manager.spawn_fruit_solo(self.level)
+        pool = self.fruits
+        fallen = pool.step(self.HEIGHT)
+        self.grid.update(pool)
+        missed = int(np.count_nonzero(fallen & ~pool.is_bomb[:pool.count]))
+        if missed:
+            self.missed += missed
+            if self.missed >= 10 and not self.game_over:
+                self.game_over = True
+                self.show_go_screen = True
+                self.go_start_ticks = pygame.time.get_ticks()
+                self.game_over_time = time.time()
+
+        self.fruit_manager.fill_solo(pool, pool.free_slots(), self.level, grid=self.grid)
     
+    def _play(self, key):
+        # Waktu play() dipisah dari "simulate" di profiler
+        start = time.perf_counter()
+        self.sounds.play(key)
+        self.sound_ms += (time.perf_counter() - start) * 1000
+
+    def _simulate(self, now):
+        # Logika game tanpa render; dipakai run() dan mode headless
+        self.recorder.frame(now)
+        for _ in range(self.timestep.advance(now)):
+            self._update_fruits()
+        if not self.game_over:
+            self._poll_hand(now)
+
+    def _draw_hud(self, dirty):
+        hud = (
+            (f"Score: {self.score}", 48, (255, 255, 255)),
+            (f"Miss: {self.missed}/10", 48, (255, 0, 0)),
+            (f"Level: {self.level}", 48, (255, 255, 0)),
+        )
+        for i, (text, size, color) in enumerate(hud):
+            rect = self.screen.blit(self.text.render(text, size, color, self.FONT), (30, 20 + i * 60))
+            dirty.append(self.presenter.add_overlay(rect))
+
+    def _leaderboard_stats(self):
+        try:
+            rank = self.leaderboard.rank("solo", self.score)
+            best = max(self.leaderboard.best("solo"), self.score)
+        except sqlite3.Error as e:
+            print(f"Leaderboard tidak bisa dibaca: {e}")
+            return 1, self.score
+        return rank, best
+
     def _setup_gameover_ui(self):
         cx = self.WIDTH // 2
         cy = self.HEIGHT // 2
@@ -182,37 +254,39 @@ class SoloFruitNinjaGame:
     def run(self):
         running = True
         while running:
-            success, cam = self.cap.read()
-            if not success:
-                time.sleep(0.05)
-                continue
+            # Profiler nyata hanya dipakai saat HUD (F3) atau log aktif
+            prof = self.profiler if self.profiler.active else NULL_PROFILER
+            prof.begin_frame()
+
+            success, cam, cam_time = self.camera.read()
+            if success:
+                self.hand_tracker.submit(cv2.flip(cam, 1), cam_time)
+            prof.mark("capture")
 
-            cam = cv2.flip(cam, 1)
             self._update_size()
 
-            frame = self.background.copy()
+            frame = self.presenter.begin(self.background)
             now = time.time()
-            self._update_fruits()
+            self.sound_ms = 0.0
+            self._simulate(now)
+            prof.mark("simulate")
+            prof.record("sound", self.sound_ms, within="simulate")
 
-            for fruit in self.fruits:
-                if fruit.alive:
-                    frame = self._overlay_image(
-                        frame, fruit.img, int(fruit.x), int(fruit.y)
-                    )
+            sprites = self.sprites
+            for sprite_id, x, y in self.fruits.draw_list(self.timestep.alpha, self.presenter.scale):
+                self.presenter.add(self.compositor.blit(frame, sprites[sprite_id], x, y))
 
             if not self.game_over:
-                frame = self._handle_hand(cam, frame, now)
-
-                cv2.putText(frame, f"Score: {self.score}", (30, 60),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255,255,255), 3)
-                cv2.putText(frame, f"Miss: {self.missed}/10", (30, 120),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0,0,255), 3)
-                cv2.putText(frame, f"Level: {self.level}", (30, 180),
-                            cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0,255,255), 3)
+                frame = self._draw_pointer(frame)
             
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            surface = pygame.surfarray.make_surface(frame_rgb.swapaxes(0, 1))
-            self.screen.blit(surface, (0, 0))
+            prof.mark("composite")
+
+            if self.game_over:
+                # Overlay game over menutupi seluruh layar
+                self.presenter.invalidate()
+            dirty = self.presenter.present(self.screen)
+            if not self.game_over:
+                self._draw_hud(dirty)
 
             if self.game_over:
 
@@ -223,8 +297,7 @@ class SoloFruitNinjaGame:
                 elapsed = pygame.time.get_ticks() - self.go_start_ticks
 
                 if self.show_go_screen and elapsed < self.GO_DURATION:
-                    font_go = pygame.font.Font(self.FONT, 96)
-                    go_text = font_go.render("GAME OVER", True, (255, 60, 60))
+                    go_text = self.text.render("GAME OVER", 96, (255, 60, 60), self.FONT)
                     go_rect = go_text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2))
                     self.screen.blit(go_text, go_rect)
                 else:
@@ -235,31 +308,55 @@ class SoloFruitNinjaGame:
                     self.screen.blit(self.btn2_img, self.btn2_rect)
                     self.screen.blit(self.btn3_img, self.btn3_rect)
 
-                    font_score = pygame.font.Font(self.FONT, 36)
-                    score_text = font_score.render(f"SCORE : {self.score}", True, (0, 0, 0))
-                    level_text = font_score.render(f"LEVEL : {self.level}", True, (0, 0, 0))
+                    if self.go_stats is None:
+                        self.go_stats = self._leaderboard_stats()
+                    rank, best = self.go_stats
+
+                    score_text = self.text.render(f"SCORE : {self.score}", 36, (0, 0, 0), self.FONT)
+                    level_text = self.text.render(f"LEVEL : {self.level}", 36, (0, 0, 0), self.FONT)
+                    rank_text = self.text.render(f"RANK : {rank}   BEST : {best}", 28, (0, 0, 0), self.FONT)
                     score_rect = score_text.get_rect(
-                        center=(self.card_rect.centerx, self.card_rect.centery - 30)
+                        center=(self.card_rect.centerx, self.card_rect.centery - 45)
                     )
                     level_rect = level_text.get_rect(   
-                        center=(self.card_rect.centerx, self.card_rect.centery + 30)
+                        center=(self.card_rect.centerx, self.card_rect.centery + 5)
+                    )
+                    rank_rect = rank_text.get_rect(
+                        center=(self.card_rect.centerx, self.card_rect.centery + 55)
                     )
                     self.screen.blit(score_text, score_rect)
                     self.screen.blit(level_text, level_rect)
+                    self.screen.blit(rank_text, rank_rect)
 
             if self.save_message:
                 if time.time() - self.save_message_time < 2.5:
-                    font = pygame.font.Font(self.FONT, 28)
-                    text = font.render(self.save_message, True, (0, 255, 0))
+                    text = self.text.render(self.save_message, 28, (0, 255, 0), self.FONT)
                     text_rect = text.get_rect(center=(self.WIDTH // 2, self.HEIGHT // 2 + 265))
                     self.screen.blit(text, text_rect)
+                    dirty.append(self.presenter.add_overlay(text_rect))
                 else:
                     self.save_message = None
 
-            pygame.display.flip()
-            self.clock.tick(20)
+            if self.profiler.show_hud:
+                hud_rect = self.profiler.draw(self.screen, (10, self.HEIGHT - 200))
+                dirty.append(self.presenter.add_overlay(hud_rect))
+            prof.mark("present")
+
+            pygame.display.update([rect for rect in dirty if rect is not None])
+            prof.mark("flip")
+            self.clock.tick(self.FPS)
+            prof.mark("wait")
+
+            if prof.active:
+                tracked = self.hand_tracker.latest()
+                if tracked is not None and tracked.seq != self.profiled_seq:
+                    self.profiled_seq = tracked.seq
+                    prof.record("mediapipe", tracked.process_ms)
+            prof.end_frame()
 
             for event in pygame.event.get():
+                if event.type == pygame.VIDEOEXPOSE:
+                    self.presenter.invalidate()
                 if event.type == pygame.QUIT:
                     self._cleanup()
                     return "exit"
@@ -268,6 +365,15 @@ class SoloFruitNinjaGame:
                     if event.key == pygame.K_ESCAPE:
                         self._cleanup()
                         return "menu"
+                    if event.key == pygame.K_F3:
+                        self.profiler.toggle_hud()
+                        self.presenter.invalidate()
+                    if event.key == pygame.K_F5:
+                        self.runtime.step_render_scale(-1)
+                    if event.key == pygame.K_F6:
+                        self.runtime.step_render_scale(1)
+                    if event.key == pygame.K_F7:
+                        self.runtime.cycle_tracking_size()
                     if self.game_over and event.key == pygame.K_r:
                         self.reset_game()
 
@@ -291,6 +397,10 @@ class SoloFruitNinjaGame:
         return "menu"
     
     def _cleanup(self):
-        self.cap.release()
-        self.hand_tracker.close()
+        self.recorder.stop()
+        self.leaderboard.close()
+        if self.owns_runtime:
+            self.runtime.close()
+        else:
+            self.runtime.release()
         print("Solo game closed safely.")
\ No newline at end of file
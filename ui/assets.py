@@ -0,0 +1,44 @@
+from collections import OrderedDict
+import pygame
+
+class AssetManager:
+    def __init__(self, max_scaled=128):
+        self.images = {}
+        self.scaled_cache = OrderedDict()
+        self.max_scaled = max_scaled
+        self.screen_size = None
+
+    def image(self, path, alpha=True):
+        key = (path, alpha)
+        img = self.images.get(key)
+        if img is None:
+            img = pygame.image.load(path)
+            img = img.convert_alpha() if alpha else img.convert()
+            self.images[key] = img
+        return img
+
+    def scaled(self, path, size, alpha=True, smooth=False):
+        key = (path, tuple(size), alpha, smooth)
+        img = self.scaled_cache.get(key)
+        if img is not None:
+            self.scaled_cache.move_to_end(key)
+            return img
+
+        base = self.image(path, alpha)
+        if smooth:
+            img = pygame.transform.smoothscale(base, size)
+        else:
+            img = pygame.transform.scale(base, size)
+
+        self.scaled_cache[key] = img
+        while len(self.scaled_cache) > self.max_scaled:
+            self.scaled_cache.popitem(last=False)
+        return img
+
+    def check_resize(self, size):
+        # Ukuran jendela berubah: varian hasil scale lama tidak dipakai lagi
+        if size != self.screen_size:
+            self.screen_size = size
+            self.scaled_cache.clear()
+            return True
+        return False
@@ -1,7 +1,8 @@
 import pygame
 import sys
-from game.solo_game import SoloFruitNinjaGame
-from game.multi_game import MultiFruitNinjaGame
+import time
+from ui.assets import AssetManager
+from game.runtime import GameRuntime
 
 class MenuApp:
     def __init__(self):
@@ -11,13 +12,12 @@ class MenuApp:
         self.MENU_MUSIC = "assets/sounds/music.mp3"
         self.WIDTH, self.HEIGHT = 1280, 720
         self.BUTTON_SIZE = (320, 120)
+        self.MENU_FPS = 30
         self.FONT = "assets/font/Gang_of_Three_Regular.ttf"
 
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Ninja Fruits Navigation")
 
-        self.font_big = pygame.font.Font(self.FONT, 60)
-
         self.themes = {
             "kaktus": "assets/themes/1.png",
             "kayu": "assets/themes/2.png",
@@ -26,11 +26,15 @@ class MenuApp:
         }
         self.selected_theme = "kayu"
 
-        self.bg_main = pygame.image.load(self.themes[self.selected_theme])
-        self.bg_main = pygame.transform.scale(self.bg_main, (self.WIDTH, self.HEIGHT))
-
+        self.assets = AssetManager()
         self.button_anim_state = {}
 
+        self.clock = pygame.time.Clock()
+        self.drawn_rects = {}
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.animating = False
+
         self.theme_icons = {
             "kaktus": "assets/images2/kaktus.png",
             "kayu": "assets/images2/kayu.png",
@@ -38,24 +42,68 @@ class MenuApp:
             "sakura": "assets/images2/sakura.png",
         }
         
-        self.back_img = pygame.image.load("assets/images2/kembali.png")
-        self.back_img = pygame.transform.scale(self.back_img, (200, 90))
+        self.back_img = self.assets.scaled("assets/images2/kembali.png", (200, 90))
+
+        # Kamera, tracker, atlas dan suara dibuat sekali dan dipinjamkan ke tiap game.
+        # Dimuat di background supaya menu pertama langsung tampil.
+        self.runtime = GameRuntime(self.WIDTH, self.HEIGHT).start_async()
+        self.text = self.runtime.text
+        self.first_frame_time = None
 
     def lerp(self, a, b, t):
         return a + (b - a) * t
 
+    def begin_frame(self):
+        self.dirty_rects = []
+        self.animating = False
+
+    def mark_dirty(self, key, rect):
+        # Area hanya perlu di-update kalau posisinya/ukurannya berubah
+        old = self.drawn_rects.get(key)
+        if old != rect:
+            self.dirty_rects.append(rect if old is None else rect.union(old))
+            self.drawn_rects[key] = rect
+
+    def end_frame(self):
+        if self.full_redraw:
+            pygame.display.update()
+            self.full_redraw = False
+        elif self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter()
+
+        if self.animating:
+            self.clock.tick(self.MENU_FPS)
+            events = pygame.event.get()
+        else:
+            # Tidak ada animasi: tidur sampai ada input
+            events = [pygame.event.wait()]
+            events.extend(pygame.event.get())
+            self.clock.tick()
+
+        for event in events:
+            if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE):
+                self.full_redraw = True
+        return events
+
     def blit_scaled_background(self):
-        w, h = self.screen.get_size()
-        bg_scaled = pygame.transform.scale(self.bg_main, (w, h))
+        size = self.screen.get_size()
+        if self.assets.check_resize(size):
+            self.full_redraw = True
+        bg_scaled = self.assets.scaled(self.themes[self.selected_theme], size, alpha=False)
         self.screen.blit(bg_scaled, (0, 0))
 
     def reset_layar(self):
-        pygame.display.quit()
-        pygame.display.init()
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Ninja Fruits Navigation")
-        self.bg_main = pygame.image.load(self.themes[self.selected_theme])
-        self.bg_main = pygame.transform.scale(self.bg_main, (self.WIDTH, self.HEIGHT))
+        self.drawn_rects = {}
+        self.full_redraw = True
+
+    def quit(self):
+        self.runtime.close()
+        pygame.quit()
+        sys.exit()
 
     def fade_transition(self):
         width, height = self.screen.get_size()
@@ -66,13 +114,13 @@ class MenuApp:
             self.screen.blit(fade, (0, 0))
             pygame.display.update()
             pygame.time.delay(18)
+        self.full_redraw = True
 
     def wait_release(self):
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
     
             if not pygame.mouse.get_pressed()[0]:
                 break
@@ -83,7 +131,6 @@ class MenuApp:
         if scale is None:
             scale = self.BUTTON_SIZE
 
-        img = pygame.image.load(image_path)
         btn_id = (image_path, pos)
         if btn_id not in self.button_anim_state:
             self.button_anim_state[btn_id] = 1.0
@@ -97,19 +144,39 @@ class MenuApp:
         self.button_anim_state[btn_id] = self.lerp(self.button_anim_state[btn_id], target, anim_speed)
 
         s = self.button_anim_state[btn_id]
+        if abs(s - target) > 0.002:
+            self.animating = True
         new_w = int(scale[0] * s)
         new_h = int(scale[1] * s)
 
-        img = pygame.transform.smoothscale(img, (new_w, new_h))
+        img = self.assets.scaled(image_path, (new_w, new_h), smooth=True)
         rect = img.get_rect(center=base_rect.center)
 
         self.screen.blit(img, rect.topleft)
+        self.mark_dirty(btn_id, rect)
 
         if is_hover and click[0]:
             pygame.time.wait(150)
             return True
         return False
 
+    def draw_main_menu(self):
+        self.blit_scaled_background()
+        width, height = self.screen.get_size()
+
+        image = self.assets.image("assets/images2/45.png")
+        self.screen.blit(image, image.get_rect(center=(width // 2, 150)).topleft)
+
+        center_x = width // 2 - 220 // 2
+        play_y = 300
+
+        play = self.draw_image_button("assets/images2/play.png", (center_x, play_y), scale=(150,150))
+
+        exit_x = 20
+        exit_y = 20
+        exit_ = self.draw_image_button("assets/images2/exit.png", (exit_x, exit_y),scale=(70,70))
+        return play, exit_
+
     def main_menu(self):
         self.reset_layar()
         try:
@@ -120,43 +187,34 @@ class MenuApp:
 
         running = True
         while running:
-            self.blit_scaled_background()
-            width, height = self.screen.get_size()
-
-            image = pygame.image.load("assets/images2/45.png").convert_alpha()
-            self.screen.blit(image, image.get_rect(center=(width // 2, 150)).topleft)
-
-            btn_w, btn_h = (220,220)
-            center_x = width // 2 - btn_w // 2
-            play_y = 300
-            exit_y = play_y + btn_h + 10
+            self.begin_frame()
+            play, exit_ = self.draw_main_menu()
 
-            if self.draw_image_button("assets/images2/play.png", (center_x, play_y), scale=(150,150)):
+            if play:
                 self.wait_release()
                 self.fade_transition()
                 self.mode_menu()
 
-            exit_x = 20
-            exit_y = 20
-            if self.draw_image_button("assets/images2/exit.png", (exit_x, exit_y),scale=(70,70)):
+            if exit_:
                 self.wait_release()
-                pygame.quit()
-                sys.exit()
+                self.quit()
 
-            pygame.display.update()
-            for event in pygame.event.get():
+            for event in self.end_frame():
                 if event.type == pygame.QUIT:
                     running = False
 
+        self.runtime.close()
+
     # Menu mode
     def mode_menu(self):
         self.reset_layar()
         running = True
         while running:
+            self.begin_frame()
             self.blit_scaled_background()
             width, height = self.screen.get_size()
 
-            title = self.font_big.render("Select Mode", True, (255, 255, 0))
+            title = self.text.render("Select Mode", 60, (255, 255, 0), self.FONT)
             self.screen.blit(title, (width // 2 - title.get_width() // 2, 80))
 
             btn_w, btn_h = self.BUTTON_SIZE
@@ -168,7 +226,8 @@ class MenuApp:
             if self.draw_image_button("assets/images2/solo.png", (center_x, solo_y)):
                 self.wait_release()
                 self.fade_transition()
-                game = SoloFruitNinjaGame(self.themes[self.selected_theme])
+                from game.solo_game import SoloFruitNinjaGame
+                game = SoloFruitNinjaGame(self.themes[self.selected_theme], runtime=self.runtime.wait_ready())
                 result = game.run()
                 if result == "menu":
                     self.reset_layar()
@@ -177,13 +236,13 @@ class MenuApp:
                     self.fade_transition()
                     return
                 elif result == "exit":
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
 
             if self.draw_image_button("assets/images2/multi.png", (center_x, multi_y)):
                 self.wait_release()
                 self.fade_transition()
-                game = MultiFruitNinjaGame(self.themes[self.selected_theme])
+                from game.multi_game import MultiFruitNinjaGame
+                game = MultiFruitNinjaGame(self.themes[self.selected_theme], runtime=self.runtime.wait_ready())
                 result = game.run()
                 if result == "menu":
                     self.reset_layar()
@@ -192,8 +251,7 @@ class MenuApp:
                     self.fade_transition()
                     return
                 elif result == "exit":
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
 
             if self.draw_image_button("assets/images2/tema.png", (center_x, theme_y)):
                 self.wait_release()
@@ -207,20 +265,18 @@ class MenuApp:
                 self.fade_transition()
                 return 
 
-            pygame.display.update()
-            for event in pygame.event.get():
+            for event in self.end_frame():
                 if event.type == pygame.QUIT:
                     running = False
 
     def theme_menu(self):
         running = True
         while running:
+            self.begin_frame()
             WIDTH, HEIGHT = self.screen.get_size()
-            bg = pygame.image.load(self.themes[self.selected_theme])
-            bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
-            self.screen.blit(bg, (0, 0))
+            self.blit_scaled_background()
 
-            title = self.font_big.render("Pilih tema", True, (255, 255, 0))
+            title = self.text.render("Pilih tema", 60, (255, 255, 0), self.FONT)
             self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 60))
 
             num_themes = len(self.themes)
@@ -236,8 +292,7 @@ class MenuApp:
             current_x = start_x
 
             for name, path in self.themes.items():
-                img = pygame.image.load(path)
-                img = pygame.transform.scale(img, (img_w, img_h))
+                img = self.assets.scaled(path, (img_w, img_h), alpha=False)
                 img_rect = pygame.Rect(current_x, y_img, img_w, img_h)
                 self.screen.blit(img, img_rect.topleft)
 
@@ -246,17 +301,16 @@ class MenuApp:
 
                 icon_path = self.theme_icons.get(name)
                 if icon_path:
-                    icon = pygame.image.load(icon_path)
                     if img_rect.collidepoint(mouse_pos):
-                        icon = pygame.transform.scale(icon, (165, 165))
+                        icon = self.assets.scaled(icon_path, (165, 165))
                     else:
-                        icon = pygame.transform.scale(icon, (140, 140))
+                        icon = self.assets.scaled(icon_path, (140, 140))
                     icon_rect = icon.get_rect(center=(current_x + img_w // 2, y_icon + 35))
                     self.screen.blit(icon, icon_rect.topleft)
+                    self.mark_dirty(("icon", name), icon_rect)
 
                 if click and (img_rect.collidepoint(mouse_pos) or icon_rect.collidepoint(mouse_pos)):
                     self.selected_theme = name
-                    self.bg_main = pygame.image.load(self.themes[self.selected_theme])
                     self.fade_transition()
                     return
 
@@ -270,9 +324,6 @@ class MenuApp:
                 self.fade_transition()
                 return
 
-            pygame.display.update()
-
-            for event in pygame.event.get():
+            for event in self.end_frame():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
\ No newline at end of file
+                    self.quit()
\ No newline at end of file
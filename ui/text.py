@@ -0,0 +1,32 @@
+from collections import OrderedDict
+import pygame
+
+class TextRenderer:
+    def __init__(self, default_font="assets/font/Gang_of_Three_Regular.ttf", max_surfaces=256):
+        self.default_font = default_font
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+
+    def font(self, size, path=None):
+        # File TTF hanya di-parse sekali per (font, ukuran)
+        key = (path or self.default_font, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = pygame.font.Font(key[0], size)
+        return font
+
+    def render(self, text, size, color, font=None, background=None):
+        key = (font or self.default_font, text, size, tuple(color), background)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = self.font(size, font).render(text, True, color, background)
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface